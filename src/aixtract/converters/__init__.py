@@ -1,28 +1,79 @@
-"""Document converters - auto-registration on import."""
-from aixtract.converters.base import BaseConverter
-
-
-# Optional format converters - import errors are caught gracefully
-def _safe_import(module: str) -> None:
-    """Import a converter module, silently ignoring ImportError."""
-    try:
-        __import__(module, fromlist=["_"])
-    except ImportError:
-        pass
-
+"""Document converters - auto-registration on import.
 
+Core text formats register eagerly; the optional binary-format
+converters register lazily by module path so importing this package
+doesn't execute every converter module up front. The real class is
+imported on first lookup through the registry.
+"""
 # Core formats (no extra dependencies beyond markitdown)
-_safe_import("aixtract.converters.text")
-_safe_import("aixtract.converters.archive")
+import aixtract.converters.archive  # noqa: F401,E402
+import aixtract.converters.text  # noqa: F401,E402
+from aixtract.converters.base import BaseConverter
+from aixtract.core.registry import ConverterRegistry
+
+# Optional format converters: name -> (module, extensions, mimetypes, requires).
+# Metadata mirrors each converter class so listing/dispatch works pre-import.
+_LAZY_CONVERTERS: dict[str, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {
+    "pdf": (
+        "aixtract.converters.pdf",
+        (".pdf",),
+        ("application/pdf",),
+        ("pypdf", "pdfplumber"),
+    ),
+    "docx": (
+        "aixtract.converters.docx",
+        (".docx", ".doc"),
+        (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/msword",
+        ),
+        ("docx",),
+    ),
+    "xlsx": (
+        "aixtract.converters.xlsx",
+        (".xlsx", ".xls"),
+        (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            "application/vnd.ms-excel",
+        ),
+        ("openpyxl",),
+    ),
+    "pptx": (
+        "aixtract.converters.pptx",
+        (".pptx", ".ppt"),
+        (
+            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            "application/vnd.ms-powerpoint",
+        ),
+        ("pptx",),
+    ),
+    "html": (
+        "aixtract.converters.html",
+        (".html", ".htm"),
+        ("text/html",),
+        ("bs4",),
+    ),
+    "epub": (
+        "aixtract.converters.epub",
+        (".epub",),
+        ("application/epub+zip",),
+        ("ebooklib", "bs4"),
+    ),
+    "image": (
+        "aixtract.converters.image",
+        (".png", ".jpg", ".jpeg", ".tiff", ".bmp"),
+        ("image/png", "image/jpeg", "image/tiff", "image/bmp"),
+        ("PIL", "pytesseract"),
+    ),
+    "audio": (
+        "aixtract.converters.audio",
+        (".mp3", ".wav", ".m4a", ".flac", ".ogg"),
+        ("audio/mpeg", "audio/wav", "audio/x-wav", "audio/flac", "audio/ogg"),
+        ("whisper",),
+    ),
+}
 
-# Optional format converters
-_safe_import("aixtract.converters.pdf")
-_safe_import("aixtract.converters.docx")
-_safe_import("aixtract.converters.xlsx")
-_safe_import("aixtract.converters.pptx")
-_safe_import("aixtract.converters.html")
-_safe_import("aixtract.converters.epub")
-_safe_import("aixtract.converters.image")
-_safe_import("aixtract.converters.audio")
+for _name, (_module, _exts, _mimes, _requires) in _LAZY_CONVERTERS.items():
+    ConverterRegistry.register_lazy(_name, _module, _exts, _mimes, _requires)
 
 __all__ = ["BaseConverter"]
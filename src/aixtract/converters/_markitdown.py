@@ -6,6 +6,7 @@ Licensed under the Apache License, Version 2.0
 """
 from __future__ import annotations
 
+import io
 import os
 from pathlib import Path
 from typing import ClassVar
@@ -23,11 +24,12 @@ class MarkItDownBackend:
     or as the primary converter for formats without native support.
     """
 
-    SUPPORTED_FORMATS: ClassVar[list[str]] = [
+    # frozenset: can_handle runs for every file the engine sees
+    SUPPORTED_FORMATS: ClassVar[frozenset[str]] = frozenset((
         ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
         ".epub", ".html", ".htm", ".jpg", ".jpeg", ".png",
         ".mp3", ".wav", ".csv", ".json", ".xml", ".zip", ".txt",
-    ]
+    ))
 
     def __init__(self) -> None:
         from markitdown import MarkItDown
@@ -55,7 +57,7 @@ class MarkItDownBackend:
         if not self.can_handle(file_path):
             raise ValueError(
                 f"Unsupported format: {file_path}. "
-                f"Supported: {self.SUPPORTED_FORMATS}"
+                f"Supported: {sorted(self.SUPPORTED_FORMATS)}"
             )
 
         result = self.converter.convert(file_path)
@@ -74,3 +76,38 @@ class MarkItDownBackend:
                 char_count=len(content),
             ),
         )
+
+    def convert_bytes(self, content: bytes, filename: str) -> ExtractionResult:
+        """Convert in-memory bytes to markdown without a temp file.
+
+        Args:
+            content: Raw file content.
+            filename: Original filename (drives format dispatch).
+
+        Returns:
+            ExtractionResult with markdown content.
+        """
+        if not self.can_handle(filename):
+            raise ValueError(
+                f"Unsupported format: {filename}. "
+                f"Supported: {sorted(self.SUPPORTED_FORMATS)}"
+            )
+
+        _, suffix = os.path.splitext(filename)
+        result = self.converter.convert_stream(
+            io.BytesIO(content), file_extension=suffix
+        )
+        text = result.text_content
+
+        return ExtractionResult(
+            success=True,
+            content=text,
+            content_markdown=text,
+            metadata=DocumentMetadata(
+                filename=filename,
+                file_size=len(content),
+                converter_used="markitdown",
+                word_count=len(text.split()),
+                char_count=len(text),
+            ),
+        )
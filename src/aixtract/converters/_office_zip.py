@@ -0,0 +1,50 @@
+"""Shared ZIP container handle for OOXML-style packages.
+
+Parsing a ZIP central directory costs O(entries); when several readers
+inspect the same office document (format probing, a fast path, then a
+fallback), each ``zipfile.ZipFile(...)`` re-parses it. ``OfficePackage``
+opens the container once and serves member reads from that single
+handle, routing decompression through :func:`fast_read_member`.
+
+The third-party office libraries (python-docx, openpyxl, python-pptx)
+manage their own ZipFile internally, so this helper is for the code in
+this package that reads members directly.
+"""
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+from typing import BinaryIO
+
+from aixtract.converters._zip_fast import fast_read_member
+
+
+class OfficePackage:
+    """A ZIP container opened once, shared across member reads."""
+
+    def __init__(self, source: Path | BinaryIO | bytes) -> None:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        self._zf = zipfile.ZipFile(source)
+
+    def namelist(self) -> list[str]:
+        """Member names, from the already-parsed central directory."""
+        return self._zf.namelist()
+
+    def infolist(self) -> list[zipfile.ZipInfo]:
+        """Member metadata, from the already-parsed central directory."""
+        return self._zf.infolist()
+
+    def read(self, member: str) -> bytes:
+        """Read and decompress one member."""
+        return fast_read_member(self._zf, member)
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def __enter__(self) -> OfficePackage:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
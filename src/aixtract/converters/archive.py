@@ -1,15 +1,17 @@
 """ZIP archive converter."""
 from __future__ import annotations
 
-import io
-import zipfile
 from pathlib import Path
 from typing import BinaryIO, ClassVar
 
+from aixtract.converters._office_zip import OfficePackage
 from aixtract.converters.base import BaseConverter
 from aixtract.core.registry import ConverterRegistry
 from aixtract.models.result import DocumentMetadata, ExtractionResult
 
+# Archive members with these extensions are extracted as text
+_TEXT_EXTENSIONS = frozenset((".txt", ".md", ".csv", ".json", ".xml", ".log", ".rst"))
+
 
 @ConverterRegistry.register
 class ZIPConverter(BaseConverter):
@@ -32,22 +34,21 @@ class ZIPConverter(BaseConverter):
         markdown_parts = []
         file_list = []
 
-        with zipfile.ZipFile(io.BytesIO(content_bytes)) as zf:
-            for info in zf.infolist():
+        with OfficePackage(content_bytes) as pkg:
+            for info in pkg.infolist():
                 if info.is_dir():
                     continue
                 file_list.append(info.filename)
 
                 # Try to extract text from supported text files
                 ext = Path(info.filename).suffix.lower()
-                if ext in (".txt", ".md", ".csv", ".json", ".xml", ".log", ".rst"):
+                if ext in _TEXT_EXTENSIONS:
                     try:
-                        with zf.open(info) as f:
-                            content = f.read().decode("utf-8", errors="replace")
-                            markdown_parts.append(
-                                f"## {info.filename}\n\n{content}"
-                            )
-                            text_parts.append(content)
+                        content = self._decode_utf8(pkg.read(info.filename))
+                        markdown_parts.append(
+                            f"## {info.filename}\n\n{content}"
+                        )
+                        text_parts.append(content)
                     except Exception:
                         markdown_parts.append(
                             f"## {info.filename}\n\n*[Could not extract]*"
@@ -1,8 +1,11 @@
 """Base converter interface."""
 from __future__ import annotations
 
+import codecs
+import io
 import re
 from abc import ABC, abstractmethod
+from functools import singledispatch
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO, ClassVar
 
@@ -11,6 +14,47 @@ if TYPE_CHECKING:
     from aixtract.models.result import ExtractionResult
 
 
+# Cached decoder function: skips the codecs registry lookup that
+# bytes.decode("utf-8", ...) performs on every call.
+_UTF8_DECODE = codecs.getdecoder("utf-8")
+
+# Word counting via finditer avoids materializing the list[str] that
+# text.split() would allocate (one str object per token).
+_WORD_RE = re.compile(r"\S+")
+
+_NEWLINE_RUN_RE = re.compile(r"\n{3,}")
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without building a token list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+@singledispatch
+def _read(source: object) -> tuple[bytes, Path | None]:
+    """Read a source into bytes, dispatching on the concrete type."""
+    # Fallback for file-like objects that don't subclass io.IOBase
+    read = getattr(source, "read", None)
+    if read is not None:
+        return read(), None
+    raise TypeError(f"Unsupported source type: {type(source).__name__}")
+
+
+@_read.register(bytes)
+def _(source: bytes) -> tuple[bytes, Path | None]:
+    return source, None
+
+
+@_read.register(Path)
+def _(source: Path) -> tuple[bytes, Path | None]:
+    return source.read_bytes(), source
+
+
+@_read.register(io.IOBase)
+def _(source: io.IOBase) -> tuple[bytes, Path | None]:
+    return source.read(), None
+
+
 class BaseConverter(ABC):
     """Abstract base class for document converters."""
 
@@ -22,13 +66,32 @@ class BaseConverter(ABC):
     # Optional dependencies
     requires: ClassVar[tuple[str, ...]] = ()
 
+    # Normalized lookup sets, built per subclass in __init_subclass__
+    _ext_set: ClassVar[frozenset[str]] = frozenset()
+    _mime_set: ClassVar[frozenset[str]] = frozenset()
+
+    # Set once the class has passed a dependency check, so repeated
+    # instantiation (one converter per extract call) skips the probes
+    _deps_validated: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._ext_set = frozenset(
+            e.lower().lstrip('.') for e in getattr(cls, "supported_extensions", ())
+        )
+        cls._mime_set = frozenset(getattr(cls, "supported_mimetypes", ()))
+        # Each subclass validates its own requires tuple
+        cls._deps_validated = False
+
     def __init__(self, config: "ExtractionConfig | None" = None) -> None:
         from aixtract.models.config import ExtractionConfig
         self.config = config or ExtractionConfig()
         self._validate_dependencies()
 
     def _validate_dependencies(self) -> None:
-        """Check if required packages are available."""
+        """Check if required packages are available (cached per class)."""
+        if type(self)._deps_validated:
+            return
         missing = []
         for package in self.requires:
             try:
@@ -41,6 +104,7 @@ class BaseConverter(ABC):
                 f"Converter '{self.name}' requires: {', '.join(missing)}. "
                 f"Install with: pip install aixtract[{self.name}]"
             )
+        type(self)._deps_validated = True
 
     @abstractmethod
     def extract(
@@ -54,25 +118,36 @@ class BaseConverter(ABC):
     @classmethod
     def can_handle(cls, extension: str, mimetype: str | None = None) -> bool:
         """Check if converter can handle this file type."""
-        ext = extension.lower().lstrip('.')
-        if ext in [e.lstrip('.') for e in cls.supported_extensions]:
-            return True
-        if mimetype and mimetype in cls.supported_mimetypes:
+        # Fast path for mimetype-only dispatch (the common case when
+        # magic-based MIME sniffing drives converter selection)
+        if not extension:
+            return bool(mimetype) and mimetype in cls._mime_set
+        if extension.lower().lstrip('.') in cls._ext_set:
             return True
-        return False
+        return bool(mimetype) and mimetype in cls._mime_set
 
     def _read_source(
         self,
         source: Path | BinaryIO | bytes,
     ) -> tuple[bytes, Path | None]:
         """Read source into bytes."""
-        if isinstance(source, bytes):
-            return source, None
-        elif isinstance(source, Path):
-            return source.read_bytes(), source
-        else:
-            # File-like object
-            return source.read(), None
+        return _read(source)
+
+    @staticmethod
+    def _decode_utf8(content_bytes: bytes) -> str:
+        """Decode bytes as UTF-8, replacing invalid sequences."""
+        return _UTF8_DECODE(content_bytes, "replace")[0]
+
+    @classmethod
+    def _normalize_text(cls, content_bytes: bytes) -> tuple[str, int, int]:
+        """Decode, collapse newline runs, and count words/chars in one call.
+
+        Fuses the text pipeline (decode -> newline collapse -> statistics)
+        so converters don't each re-traverse the string. Returns
+        (text, word_count, char_count).
+        """
+        text = cls._strip_consecutive_newlines(cls._decode_utf8(content_bytes))
+        return text, _count_words(text), len(text)
 
     @staticmethod
     def _strip_consecutive_newlines(text: str) -> str:
@@ -81,4 +156,7 @@ class BaseConverter(ABC):
         Preserves paragraph breaks (double newlines) while removing
         excessive blank lines. Adapted from CAMEL base_io.py.
         """
-        return re.sub(r"\n{3,}", "\n\n", text)
+        # Cheap C-level substring probe before paying for the regex scan
+        if "\n\n\n" not in text:
+            return text
+        return _NEWLINE_RUN_RE.sub("\n\n", text)
@@ -7,6 +7,7 @@ Licensed under the Apache License, Version 2.0
 """
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import BinaryIO, ClassVar
 
@@ -14,6 +15,23 @@ from aixtract.converters.base import BaseConverter
 from aixtract.core.registry import ConverterRegistry
 from aixtract.models.result import DocumentMetadata, ExtractionResult
 
+try:
+    # lxml (already part of the html extra) parses in C; the stdlib
+    # html.parser backend is pure Python and dominates CPU on big pages
+    import lxml  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+# Fast path for the <title> tag, matched on raw bytes before any DOM
+# build; only scans the document head, where the tag lives anyway.
+# The scan stops at the first construct that could carry <title> text
+# the parser would treat differently: the body, a comment, or a script.
+_TITLE_RE = re.compile(rb"<title[^>]*>([^<]{0,500})</title>", re.IGNORECASE)
+_TITLE_STOP_RE = re.compile(rb"<body|<!--|<script", re.IGNORECASE)
+_TITLE_SCAN_BYTES = 65536
+
 
 @ConverterRegistry.register
 class HTMLConverter(BaseConverter):
@@ -33,12 +51,26 @@ class HTMLConverter(BaseConverter):
         from bs4 import BeautifulSoup
 
         content_bytes, file_path = self._read_source(source)
-        html_content = content_bytes.decode("utf-8", errors="replace")
-
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Extract title
-        title = soup.title.string if soup.title else None
+        html_content = self._decode_utf8(content_bytes)
+
+        # Extract title from raw bytes when possible; titles containing
+        # entities defer to the parser so they decode correctly. Only
+        # matches before the first body/comment/script, where a raw
+        # <title> cannot mean anything but the document title, and keeps
+        # the value verbatim to match soup.title.string below.
+        title = None
+        head = content_bytes[:_TITLE_SCAN_BYTES]
+        stop = _TITLE_STOP_RE.search(head)
+        if stop:
+            head = head[: stop.start()]
+        match = _TITLE_RE.search(head)
+        if match and b"&" not in match.group(1):
+            title = match.group(1).decode("utf-8", errors="replace") or None
+
+        soup = BeautifulSoup(html_content, _BS4_PARSER)
+
+        if title is None:
+            title = soup.title.string if soup.title else None
 
         # Extract text content
         text = soup.get_text(separator="\n", strip=True)
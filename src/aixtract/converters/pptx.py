@@ -2,13 +2,23 @@
 from __future__ import annotations
 
 import io
+import re
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import BinaryIO, ClassVar
 
+from aixtract.converters._office_zip import OfficePackage
 from aixtract.converters.base import BaseConverter
 from aixtract.core.registry import ConverterRegistry
 from aixtract.models.result import DocumentMetadata, ExtractionResult
 
+_SLIDE_NAME_RE = re.compile(r"ppt/slides/slide(\d+)\.xml$")
+
+# DrawingML namespace used by slide text runs
+_A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_A_PARAGRAPH = f"{_A_NS}p"
+_A_TEXT = f"{_A_NS}t"
+
 
 @ConverterRegistry.register
 class PPTXConverter(BaseConverter):
@@ -27,10 +37,93 @@ class PPTXConverter(BaseConverter):
         source: Path | BinaryIO | bytes,
         filename: str | None = None,
     ) -> ExtractionResult:
-        """Extract content from PowerPoint file."""
-        from pptx import Presentation
+        """Extract content from PowerPoint file.
 
+        Text-only decks take a fast path that reads slide XML straight
+        out of the ZIP instead of building python-pptx's full shape
+        graph; decks with tables fall back to python-pptx so table
+        markdown is preserved.
+        """
         content_bytes, file_path = self._read_source(source)
+
+        slides = None
+        try:
+            slides = self._extract_slides_xml(content_bytes)
+        except Exception:
+            slides = None
+
+        if slides is None:
+            return self._extract_with_pptx(content_bytes, filename, file_path)
+
+        text_parts = []
+        markdown_parts = []
+
+        for slide_num, slide_texts in enumerate(slides, 1):
+            markdown_parts.append(f"<!-- Slide {slide_num} -->")
+            text_parts.extend(slide_texts)
+            markdown_parts.extend(slide_texts)
+            markdown_parts.append("")
+
+        content = "\n\n".join(text_parts)
+        content_markdown = "\n\n".join(markdown_parts)
+
+        metadata = DocumentMetadata(
+            filename=filename or (file_path.name if file_path else "presentation.pptx"),
+            file_path=file_path,
+            format_detected="pptx",
+            page_count=len(slides),
+            converter_used=self.name,
+            word_count=len(content.split()),
+            char_count=len(content),
+        )
+
+        return ExtractionResult(
+            success=True,
+            content=content,
+            content_markdown=content_markdown,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _extract_slides_xml(content_bytes: bytes) -> list[list[str]] | None:
+        """Read slide paragraph text directly from the OOXML ZIP.
+
+        Returns per-slide paragraph lists, or None when a slide contains
+        a table (the python-pptx path renders those as markdown).
+        """
+        slides: list[tuple[int, bytes]] = []
+        with OfficePackage(content_bytes) as pkg:
+            for member in pkg.namelist():
+                match = _SLIDE_NAME_RE.match(member)
+                if match:
+                    slides.append((int(match.group(1)), pkg.read(member)))
+
+        slides.sort()
+        result: list[list[str]] = []
+        for _, data in slides:
+            if b"<a:tbl" in data:
+                return None
+            root = ET.fromstring(data)
+            texts = []
+            for paragraph in root.iter(_A_PARAGRAPH):
+                text = "".join(
+                    t.text for t in paragraph.iter(_A_TEXT) if t.text
+                ).strip()
+                if text:
+                    texts.append(text)
+            result.append(texts)
+
+        return result
+
+    def _extract_with_pptx(
+        self,
+        content_bytes: bytes,
+        filename: str | None,
+        file_path: Path | None,
+    ) -> ExtractionResult:
+        """Full python-pptx extraction (handles tables and odd packages)."""
+        from pptx import Presentation
+
         prs = Presentation(io.BytesIO(content_bytes))
 
         text_parts = []
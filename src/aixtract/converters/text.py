@@ -18,6 +18,13 @@ from aixtract.converters.base import BaseConverter
 from aixtract.core.registry import ConverterRegistry
 from aixtract.models.result import DocumentMetadata, ExtractionResult
 
+try:
+    # Optional: reformats JSON bytes-to-bytes in C, skipping the
+    # pure-Python JSONEncoder path that json.dumps(indent=...) takes.
+    from msgspec.json import format as _msgspec_format
+except ImportError:
+    _msgspec_format = None
+
 
 @ConverterRegistry.register
 class TXTConverter(BaseConverter):
@@ -34,20 +41,20 @@ class TXTConverter(BaseConverter):
         filename: str | None = None,
     ) -> ExtractionResult:
         content_bytes, file_path = self._read_source(source)
-        text = content_bytes.decode("utf-8", errors="replace")
-        text = self._strip_consecutive_newlines(text)
+        text, word_count, char_count = self._normalize_text(content_bytes)
+        content = text.strip()
 
         return ExtractionResult(
             success=True,
-            content=text.strip(),
-            content_markdown=text.strip(),
+            content=content,
+            content_markdown=content,
             metadata=DocumentMetadata(
                 filename=filename or (file_path.name if file_path else "document.txt"),
                 file_path=file_path,
                 format_detected="txt",
                 converter_used=self.name,
-                word_count=len(text.split()),
-                char_count=len(text),
+                word_count=word_count,
+                char_count=char_count,
             ),
         )
 
@@ -67,7 +74,7 @@ class CSVConverter(BaseConverter):
         filename: str | None = None,
     ) -> ExtractionResult:
         content_bytes, file_path = self._read_source(source)
-        text = content_bytes.decode("utf-8", errors="replace")
+        text = self._decode_utf8(content_bytes)
 
         # Detect TSV by filename or content
         is_tsv = False
@@ -134,7 +141,7 @@ class JSONConverter(BaseConverter):
         filename: str | None = None,
     ) -> ExtractionResult:
         content_bytes, file_path = self._read_source(source)
-        text = content_bytes.decode("utf-8", errors="replace")
+        text = self._decode_utf8(content_bytes)
 
         try:
             data = json.loads(text)
@@ -150,7 +157,21 @@ class JSONConverter(BaseConverter):
                 ),
             )
 
-        formatted = json.dumps(data, indent=2, ensure_ascii=False)
+        # Fast path: reformat the original bytes in C. Only safe when the
+        # input contains no backslash escapes (stdlib un-escapes \uXXXX
+        # under ensure_ascii=False; msgspec's format keeps them verbatim)
+        # and msgspec accepts the document (it rejects NaN/Infinity,
+        # which json.loads above allowed).
+        formatted = None
+        if _msgspec_format is not None and b"\\" not in content_bytes:
+            try:
+                formatted = self._decode_utf8(
+                    _msgspec_format(content_bytes, indent=2)
+                )
+            except Exception:
+                formatted = None
+        if formatted is None:
+            formatted = json.dumps(data, indent=2, ensure_ascii=False)
         content_markdown = f"```json\n{formatted}\n```"
 
         return ExtractionResult(
@@ -182,7 +203,7 @@ class XMLConverter(BaseConverter):
         filename: str | None = None,
     ) -> ExtractionResult:
         content_bytes, file_path = self._read_source(source)
-        text = content_bytes.decode("utf-8", errors="replace")
+        text = self._decode_utf8(content_bytes)
 
         try:
             root = ET.fromstring(text)
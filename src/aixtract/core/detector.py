@@ -1,26 +1,43 @@
 """Format detection using python-magic and file extensions."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 import magic
 
+# Magic-number detection only ever inspects the head of the file; passing
+# a bounded prefix keeps the cache keys small and hashing cheap
+_MAGIC_PREFIX_BYTES = 4096
+
+
+@lru_cache(maxsize=1024)
+def _suffix_lower(filename: str) -> str:
+    """Lowercased extension for a filename, cached across calls."""
+    return Path(filename).suffix.lower()
+
 
 class FormatDetector:
     """Detect document format from content and extension."""
 
     def __init__(self) -> None:
         self._mime = magic.Magic(mime=True)
+        # Cache libmagic lookups per instance, keyed on the content prefix
+        self._mime_from_prefix = lru_cache(maxsize=256)(self._mime.from_buffer)
 
     def detect(
         self,
-        content: bytes | None = None,
+        content: bytes | memoryview | BinaryIO | None = None,
         filename: str | None = None,
     ) -> tuple[str | None, str | None]:
         """Detect format returning (extension, mimetype).
 
         Args:
-            content: File content bytes for magic detection.
+            content: File content for magic detection — bytes, a
+                memoryview, or a readable binary stream. Only the first
+                few KiB are inspected, so large buffers are never copied
+                whole and streams are read (and rewound) only that far.
             filename: Filename for extension-based detection.
 
         Returns:
@@ -30,9 +47,23 @@ class FormatDetector:
         mimetype = None
 
         if filename:
-            extension = Path(filename).suffix.lower()
+            extension = _suffix_lower(filename)
 
-        if content:
-            mimetype = self._mime.from_buffer(content)
+        if content is not None:
+            prefix = self._read_prefix(content)
+            if prefix:
+                mimetype = self._mime_from_prefix(prefix)
 
         return extension, mimetype
+
+    @staticmethod
+    def _read_prefix(content: bytes | memoryview | BinaryIO) -> bytes:
+        """First _MAGIC_PREFIX_BYTES of the content as bytes."""
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content[:_MAGIC_PREFIX_BYTES])
+        if isinstance(content, memoryview):
+            return content[:_MAGIC_PREFIX_BYTES].tobytes()
+        prefix = content.read(_MAGIC_PREFIX_BYTES)
+        if content.seekable():
+            content.seek(0)
+        return prefix
@@ -1,8 +1,9 @@
 """Main extraction engine."""
 from __future__ import annotations
 
+import mimetypes
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO, Iterator
 
@@ -22,6 +23,9 @@ class ExtractionEngine:
     def __init__(self, config: ExtractionConfig | None = None) -> None:
         self.config = config or ExtractionConfig()
         self._detector = FormatDetector()
+        # extension -> guessed mime type; one mimetypes-DB walk per
+        # distinct extension instead of one per file
+        self._mime_cache: dict[str, str | None] = {}
         # Ensure converters are registered
         import aixtract.converters  # noqa: F401
 
@@ -39,13 +43,23 @@ class ExtractionEngine:
                 return self._extract_from_url(source, filename)
             source = Path(source)
 
+        max_size = self.config.max_file_size_mb * 1024 * 1024
+
         # Get file info
         if isinstance(source, Path):
             if not source.exists():
                 return self._error_result(f"File not found: {source}", filename)
             filename = filename or source.name
+            # Reject oversize files from stat alone, before any read
             file_size = source.stat().st_size
-            content_bytes = source.read_bytes()
+            if file_size > max_size:
+                return self._error_result(
+                    f"File exceeds max size ({file_size} > {max_size})",
+                    filename,
+                )
+            # A 1 MiB buffer keeps the read syscall count low
+            with open(source, "rb", buffering=1 << 20) as f:
+                content_bytes = f.read()
         elif isinstance(source, bytes):
             content_bytes = source
             file_size = len(source)
@@ -53,25 +67,37 @@ class ExtractionEngine:
             content_bytes = source.read()
             file_size = len(content_bytes)
 
-        # Check file size
-        max_size = self.config.max_file_size_mb * 1024 * 1024
+        # Check file size (in-memory sources; paths were checked above)
         if file_size > max_size:
             return self._error_result(
                 f"File exceeds max size ({file_size} > {max_size})",
                 filename,
             )
 
-        # Detect format
-        extension, mimetype = self._detector.detect(
-            content=content_bytes, filename=filename
-        )
+        # Detect format. If the extension alone resolves a converter the
+        # libmagic content sniff is skipped and the mime type comes from
+        # the cached extension table; content sniffing remains the
+        # fallback for unknown or missing extensions.
+        extension, mimetype = self._detector.detect(filename=filename)
+        converter = None
+        if extension:
+            converter = ConverterRegistry.get_converter(
+                extension=extension, config=self.config
+            )
 
-        # Get converter
-        converter = ConverterRegistry.get_converter(
-            extension=extension,
-            mimetype=mimetype,
-            config=self.config,
-        )
+        if converter:
+            mimetype = self._guess_mime(filename) if filename else None
+            if mimetype is None:
+                _, mimetype = self._detector.detect(content=content_bytes)
+        else:
+            extension, mimetype = self._detector.detect(
+                content=content_bytes, filename=filename
+            )
+            converter = ConverterRegistry.get_converter(
+                extension=extension,
+                mimetype=mimetype,
+                config=self.config,
+            )
 
         if not converter:
             # Try markitdown fallback
@@ -80,21 +106,27 @@ class ExtractionEngine:
                     from aixtract.converters._markitdown import MarkItDownBackend
                     backend = MarkItDownBackend()
                     if filename and backend.can_handle(filename):
-                        import tempfile, os
-                        suffix = Path(filename).suffix
-                        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                            tmp.write(content_bytes)
-                            tmp_path = tmp.name
                         try:
-                            result = backend.convert(tmp_path)
-                            result.metadata.file_size = file_size
-                            result.metadata.mime_type = mimetype
-                            result.metadata.extraction_time_ms = (
-                                time.perf_counter() - start_time
-                            ) * 1000
-                            return result
-                        finally:
-                            os.unlink(tmp_path)
+                            # In-memory conversion: no tmpfile write/read
+                            result = backend.convert_bytes(content_bytes, filename)
+                        except Exception:
+                            # Some formats still need a real path
+                            import os
+                            import tempfile
+                            suffix = Path(filename).suffix
+                            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                                tmp.write(content_bytes)
+                                tmp_path = tmp.name
+                            try:
+                                result = backend.convert(tmp_path)
+                            finally:
+                                os.unlink(tmp_path)
+                        result.metadata.file_size = file_size
+                        result.metadata.mime_type = mimetype
+                        result.metadata.extraction_time_ms = (
+                            time.perf_counter() - start_time
+                        ) * 1000
+                        return result
                 except Exception:
                     pass
 
@@ -139,6 +171,15 @@ class ExtractionEngine:
                 raise
             return self._error_result(str(e), filename)
 
+    def _guess_mime(self, filename: str) -> str | None:
+        """Guess a mime type from the filename, cached per extension."""
+        ext = Path(filename).suffix.lower()
+        if ext in self._mime_cache:
+            return self._mime_cache[ext]
+        mime = mimetypes.guess_type(filename)[0]
+        self._mime_cache[ext] = mime
+        return mime
+
     def extract_batch(
         self,
         sources: list[str | Path],
@@ -172,6 +213,26 @@ class ExtractionEngine:
                     progress.advance(task)
                     yield source, result
 
+    def extract_many(
+        self,
+        sources: list[str | Path],
+    ) -> list[ExtractionResult]:
+        """Extract from many files in parallel across processes.
+
+        Extraction is CPU-bound (parsing, regex, chunking), so unlike
+        the thread-based :meth:`extract_batch` this fans out to a
+        process pool and sidesteps the GIL. Results come back in input
+        order.
+        """
+        with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
+            return list(
+                executor.map(
+                    _extract_one,
+                    [(source, self.config) for source in sources],
+                    chunksize=4,
+                )
+            )
+
     def _extract_from_url(
         self,
         url: str,
@@ -212,6 +273,14 @@ class ExtractionEngine:
         )
 
 
+def _extract_one(
+    args: tuple[str | Path, ExtractionConfig],
+) -> ExtractionResult:
+    """Worker for extract_many; module-level so it pickles."""
+    source, config = args
+    return ExtractionEngine(config).extract(source)
+
+
 # Convenience function
 def extract(
     source: str | Path | BinaryIO | bytes,
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from aixtract.models.config import ExtractionConfig
+
 if TYPE_CHECKING:
     from aixtract.converters.base import BaseConverter
-    from aixtract.models.config import ExtractionConfig
 
 
 class ConverterRegistry:
@@ -14,6 +15,10 @@ class ConverterRegistry:
     _converters: dict[str, type["BaseConverter"]] = {}
     _extension_map: dict[str, str] = {}
     _mimetype_map: dict[str, str] = {}
+    # name -> metadata for converters whose module hasn't been imported yet
+    _lazy: dict[str, dict] = {}
+    # memoized get_supported_extensions result; reset on registration
+    _cached_extensions: tuple[str, ...] | None = None
 
     @classmethod
     def register(cls, converter_class: type["BaseConverter"]) -> type["BaseConverter"]:
@@ -26,28 +31,74 @@ class ConverterRegistry:
         """
         name = converter_class.name
         cls._converters[name] = converter_class
+        cls._lazy.pop(name, None)
+        cls._cached_extensions = None
 
         # Map extensions
         for ext in converter_class.supported_extensions:
             ext_clean = ext.lower().lstrip('.')
             cls._extension_map[ext_clean] = name
 
-        # Map mimetypes
+        # Map mimetypes (stored lowercase so lookups normalize once)
         for mime in converter_class.supported_mimetypes:
-            cls._mimetype_map[mime] = name
+            cls._mimetype_map[mime.lower()] = name
 
         return converter_class
 
+    @classmethod
+    def register_lazy(
+        cls,
+        name: str,
+        module: str,
+        extensions: tuple[str, ...],
+        mimetypes: tuple[str, ...],
+        requires: tuple[str, ...] = (),
+    ) -> None:
+        """Register a converter by module path without importing it.
+
+        The module is imported (triggering the real ``register``) the
+        first time the converter is actually requested, so importing
+        :mod:`aixtract.converters` stays cheap for workloads that only
+        touch a few formats.
+        """
+        if name in cls._converters:
+            return
+
+        cls._cached_extensions = None
+        cls._lazy[name] = {
+            "module": module,
+            "extensions": extensions,
+            "mimetypes": mimetypes,
+            "requires": requires,
+        }
+
+        for ext in extensions:
+            cls._extension_map[ext.lower().lstrip('.')] = name
+        for mime in mimetypes:
+            cls._mimetype_map[mime.lower()] = name
+
+    @classmethod
+    def _load_lazy(cls, name: str) -> "type[BaseConverter] | None":
+        """Import a lazily registered converter's module."""
+        import importlib
+
+        entry = cls._lazy.get(name)
+        if entry is None:
+            return None
+        try:
+            importlib.import_module(entry["module"])
+        except ImportError:
+            return None
+        return cls._converters.get(name)
+
     @classmethod
     def get_converter(
         cls,
         extension: str | None = None,
         mimetype: str | None = None,
-        config: "ExtractionConfig | None" = None,
+        config: ExtractionConfig | None = None,
     ) -> "BaseConverter | None":
         """Get appropriate converter for file type."""
-        from aixtract.models.config import ExtractionConfig
-
         config = config or ExtractionConfig()
         name = None
 
@@ -56,7 +107,7 @@ class ConverterRegistry:
             name = cls._extension_map.get(ext)
 
         if not name and mimetype:
-            name = cls._mimetype_map.get(mimetype)
+            name = cls._mimetype_map.get(mimetype.lower())
 
         if not name:
             return None
@@ -64,7 +115,7 @@ class ConverterRegistry:
         if name in config.disabled_converters:
             return None
 
-        converter_class = cls._converters.get(name)
+        converter_class = cls._converters.get(name) or cls._load_lazy(name)
         if not converter_class:
             return None
 
@@ -72,8 +123,8 @@ class ConverterRegistry:
 
     @classmethod
     def list_converters(cls) -> list[dict]:
-        """List all registered converters."""
-        return [
+        """List all registered converters (without importing lazy ones)."""
+        entries = [
             {
                 "name": name,
                 "extensions": conv.supported_extensions,
@@ -82,8 +133,20 @@ class ConverterRegistry:
             }
             for name, conv in cls._converters.items()
         ]
+        entries.extend(
+            {
+                "name": name,
+                "extensions": meta["extensions"],
+                "mimetypes": meta["mimetypes"],
+                "requires": meta["requires"],
+            }
+            for name, meta in cls._lazy.items()
+        )
+        return entries
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get all supported file extensions."""
-        return list(cls._extension_map.keys())
+        if cls._cached_extensions is None:
+            cls._cached_extensions = tuple(cls._extension_map)
+        return list(cls._cached_extensions)
@@ -69,17 +69,23 @@ class ExtractionConfig(BaseModel):
     @classmethod
     def for_llm(cls) -> "ExtractionConfig":
         """Preset for LLM ingestion."""
-        return cls(
-            output_format="markdown",
-            preserve_formatting=True,
-            chunking=ChunkingConfig(enabled=True, chunk_size=2000, overlap=200),
-        )
+        return _LLM_PRESET.model_copy(deep=True)
 
     @classmethod
     def for_rag(cls) -> "ExtractionConfig":
         """Preset for RAG pipelines."""
-        return cls(
-            output_format="text",
-            preserve_formatting=False,
-            chunking=ChunkingConfig(enabled=True, chunk_size=512, overlap=50),
-        )
+        return _RAG_PRESET.model_copy(deep=True)
+
+
+# Presets validated once at import; for_llm/for_rag hand out deep copies
+# so callers can mutate their config without affecting later calls
+_LLM_PRESET = ExtractionConfig(
+    output_format="markdown",
+    preserve_formatting=True,
+    chunking=ChunkingConfig(enabled=True, chunk_size=2000, overlap=200),
+)
+_RAG_PRESET = ExtractionConfig(
+    output_format="text",
+    preserve_formatting=False,
+    chunking=ChunkingConfig(enabled=True, chunk_size=512, overlap=50),
+)
@@ -1,12 +1,26 @@
 """Extraction result models."""
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from aixtract.utils.chunking_nb import find_chunk_boundaries
+
+# Below this size the JIT boundary scan isn't worth the ASCII encode
+_CHUNK_SCAN_MIN_CHARS = 64 * 1024
+
+# Chunk separators in priority order; the lookahead form reports every
+# (including overlapping) occurrence, matching rfind semantics
+_CHUNK_SEPARATORS = [
+    (re.compile('(?=' + re.escape(sep) + ')'), len(sep))
+    for sep in ('. ', '.\n', '\n\n', '\n', ' ')
+]
 
 
 class OutputFormat(str, Enum):
@@ -48,7 +62,14 @@ class DocumentMetadata(BaseModel):
 
 
 class ContentChunk(BaseModel):
-    """A chunk of extracted content for RAG pipelines."""
+    """A chunk of extracted content for RAG pipelines.
+
+    Chunks are produced in bulk and shared (e.g. via the chunker's
+    cache), so the model is frozen: instances are immutable after
+    construction and safe to hand to multiple consumers.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     index: int
     content: str
@@ -72,20 +93,50 @@ class ExtractionResult(BaseModel):
     content_markdown: str = ""
     content_json: dict[str, Any] | None = None
 
+    # Raw bytes pass-through: converters that don't need text themselves
+    # can set this instead of content and skip the UTF-8 decode entirely.
+    # Consumers that only hash, re-embed, or stream bytes never pay for it.
+    content_bytes: bytes | None = Field(default=None, exclude=True, repr=False)
+
     metadata: DocumentMetadata
     chunks: list[ContentChunk] = Field(default_factory=list)
 
+    # get_chunks results per (chunk_size, overlap); repeat calls with the
+    # same parameters skip the boundary scan entirely
+    _chunk_cache: dict[tuple[int, int], list[ContentChunk]] = PrivateAttr(
+        default_factory=dict
+    )
+
     # Error handling
     error: str | None = None
     partial_content: bool = False
 
+    @property
+    def text(self) -> str:
+        """Text content, decoding content_bytes lazily on first access."""
+        if not self.content and self.content_bytes is not None:
+            self.content = self.content_bytes.decode("utf-8", errors="replace")
+        return self.content
+
     def to_markdown(self) -> str:
         """Return content as markdown string."""
-        return self.content_markdown or self.content
+        return self.content_markdown or self.text
 
     def to_dict(self) -> dict[str, Any]:
         """Return full result as dictionary."""
-        return self.model_dump()
+        # Built by hand rather than model_dump(): the top-level walker
+        # would re-copy the (potentially multi-MB) content strings and
+        # recurse through every chunk; only the sub-models need dumping
+        return {
+            "success": self.success,
+            "content": self.text,
+            "content_markdown": self.content_markdown,
+            "content_json": self.content_json,
+            "metadata": self.metadata.model_dump(),
+            "chunks": [chunk.model_dump() for chunk in self.chunks],
+            "error": self.error,
+            "partial_content": self.partial_content,
+        }
 
     def get_chunks(
         self,
@@ -96,25 +147,65 @@ class ExtractionResult(BaseModel):
         if self.chunks:
             return self.chunks
 
-        text = self.content
+        cached = self._chunk_cache.get((chunk_size, overlap))
+        if cached is not None:
+            # Callers get their own list so mutating it cannot poison
+            # the cache (same contract as ContentChunker.chunk)
+            return list(cached)
+
+        # The text accessor decodes content_bytes-only results lazily;
+        # reading .content directly would chunk an empty string
+        text = self.text
         chunks = []
-        start = 0
         index = 0
 
-        while start < len(text):
-            end = min(start + chunk_size, len(text))
+        # Large ASCII documents take a single numba pass that returns
+        # all boundaries at once; char offsets equal byte offsets there
+        if (
+            find_chunk_boundaries is not None
+            and len(text) >= _CHUNK_SCAN_MIN_CHARS
+            and text.isascii()
+        ):
+            starts, ends = find_chunk_boundaries(
+                text.encode("ascii"), chunk_size, overlap
+            )
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True):
+                chunk_text = text[start:end].strip()
+                if chunk_text:
+                    chunks.append(ContentChunk.model_construct(
+                        index=index,
+                        content=chunk_text,
+                        char_start=start,
+                        char_end=end,
+                    ))
+                    index += 1
+            self._chunk_cache[(chunk_size, overlap)] = chunks
+            return list(chunks)
+
+        # Index every separator position once, then find the boundary
+        # for each window with a bisect instead of rescanning the slice
+        n = len(text)
+        half = chunk_size // 2
+        sep_positions = [
+            ([m.start() for m in pattern.finditer(text)], sep_len)
+            for pattern, sep_len in _CHUNK_SEPARATORS
+        ]
+        start = 0
+
+        while start < n:
+            end = min(start + chunk_size, n)
 
             # Try to break at sentence boundary
-            if end < len(text):
-                for sep in ['. ', '.\n', '\n\n', '\n', ' ']:
-                    last_sep = text[start:end].rfind(sep)
-                    if last_sep > chunk_size // 2:
-                        end = start + last_sep + len(sep)
+            if end < n:
+                for positions, sep_len in sep_positions:
+                    i = bisect_right(positions, end - sep_len) - 1
+                    if i >= 0 and positions[i] - start > half:
+                        end = positions[i] + sep_len
                         break
 
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunks.append(ContentChunk(
+                chunks.append(ContentChunk.model_construct(
                     index=index,
                     content=chunk_text,
                     char_start=start,
@@ -124,4 +215,5 @@ class ExtractionResult(BaseModel):
 
             start = end - overlap if overlap and end < len(text) else end
 
-        return chunks
+        self._chunk_cache[(chunk_size, overlap)] = chunks
+        return list(chunks)
@@ -8,6 +8,9 @@ Licensed under the Apache License, Version 2.0
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from hashlib import blake2b
 from typing import Callable
 
 from aixtract.models.result import ContentChunk
@@ -23,7 +26,13 @@ class ContentChunker:
     Args:
         chunk_size: Maximum tokens per chunk.
         overlap: Number of overlapping characters between chunks.
-        token_counter: Optional custom token counting function.
+        token_counter: Optional custom token counting function, used for
+            the token_count_estimate on returned chunks. Interior size
+            budgeting always uses the fast built-in estimator so an
+            expensive counter (e.g. tiktoken) is never called per line.
+        token_counter_batch: Optional batch token counter taking a list
+            of texts; used to attach per-chunk counts in one call (e.g.
+            :func:`count_tokens_batch` for tiktoken).
     """
 
     def __init__(
@@ -31,13 +40,22 @@ class ContentChunker:
         chunk_size: int = 1000,
         overlap: int = 100,
         token_counter: Callable[[str], int] | None = None,
+        token_counter_batch: Callable[[list[str]], list[int]] | None = None,
     ) -> None:
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.count_tokens = token_counter or estimate_tokens
+        self._count_tokens_batch = token_counter_batch
+        # content digest -> chunks; re-chunking the same document (e.g.
+        # repeated extraction of one file) is then a dict hit. Keyed by
+        # a 16-byte hash rather than the text itself to bound memory.
+        self._chunk_cache: dict[tuple[bytes, bool], list[ContentChunk]] = {}
 
-        # Heading pattern for documents
-        self.heading_pattern = re.compile(r"^#{1,6}\s+.+$", re.MULTILINE)
+        # Heading pattern for documents. The whitespace class excludes
+        # newlines so the whole-content scan cannot run past a bare "#"
+        # line (e.g. comment framing in Python sources) onto the next
+        # line and misread it as a heading.
+        self.heading_pattern = re.compile(r"^#{1,6}[^\S\n]+.+$", re.MULTILINE)
         # Code structure pattern (adapted from CAMEL CodeChunker)
         self.struct_pattern = re.compile(
             r"^\s*(?:(def|class|function)\s+\w+|"
@@ -46,6 +64,8 @@ class ContentChunker:
             r"#\s*(region|endregion)\b)"
         )
 
+    _CACHE_MAX = 32
+
     def chunk(self, content: str, respect_structure: bool = True) -> list[ContentChunk]:
         """Split content into chunks.
 
@@ -59,16 +79,94 @@ class ContentChunker:
         if not content:
             return []
 
-        if not respect_structure:
-            return self._simple_chunk(content)
+        key = (
+            blake2b(content.encode(), digest_size=16).digest(),
+            respect_structure,
+        )
+        cached = self._chunk_cache.get(key)
+        if cached is None:
+            if respect_structure:
+                cached = self._structure_aware_chunk(content)
+            else:
+                cached = self._simple_chunk(content)
+            if len(self._chunk_cache) >= self._CACHE_MAX:
+                # Drop the oldest entry; dicts preserve insertion order.
+                # pop tolerates a concurrent chunk_batch worker having
+                # evicted the same key first.
+                with suppress(StopIteration, RuntimeError):
+                    self._chunk_cache.pop(next(iter(self._chunk_cache)), None)
+            self._chunk_cache[key] = cached
+        # Callers get their own list so mutating it cannot poison the cache
+        return list(cached)
+
+    def chunk_batch(
+        self,
+        texts: list[str],
+        n_workers: int | None = None,
+        respect_structure: bool = True,
+    ) -> list[list[ContentChunk]]:
+        """Chunk many documents in parallel threads.
+
+        Chunker configuration is read-only after __init__ and the
+        document cache tolerates concurrent access, so one instance
+        serves all workers.
 
-        return self._structure_aware_chunk(content)
+        Args:
+            texts: Documents to chunk.
+            n_workers: Worker threads; defaults to the executor's own
+                default.
+            respect_structure: Passed through to :meth:`chunk`.
+
+        Returns:
+            One list of ContentChunk per document, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(
+                executor.map(
+                    lambda text: self.chunk(text, respect_structure),
+                    texts,
+                )
+            )
+
+    def _count_many(self, texts: list[str]) -> list[int]:
+        """Token counts for a batch of chunk texts."""
+        if self._count_tokens_batch is not None:
+            return self._count_tokens_batch(texts)
+        return [self.count_tokens(text) for text in texts]
+
+    def _materialize(
+        self,
+        texts: list[str],
+        starts: list[int],
+        ends: list[int],
+    ) -> list[ContentChunk]:
+        """Turn parallel (text, start, end) arrays into ContentChunks.
+
+        The chunking passes work on these structure-of-arrays lists and
+        only pay for object construction here, at the public boundary;
+        model_construct skips validation on the self-computed fields.
+        """
+        token_counts = self._count_many(texts)
+        return [
+            ContentChunk.model_construct(
+                index=index,
+                content=text,
+                char_start=chunk_start,
+                char_end=chunk_end,
+                token_count_estimate=count,
+                metadata={},
+            )
+            for index, (text, chunk_start, chunk_end, count) in enumerate(
+                zip(texts, starts, ends, token_counts, strict=True)
+            )
+        ]
 
     def _simple_chunk(self, content: str) -> list[ContentChunk]:
         """Simple chunking with sentence boundary respect."""
-        chunks = []
+        texts: list[str] = []
+        starts: list[int] = []
+        ends: list[int] = []
         start = 0
-        index = 0
 
         while start < len(content):
             chars_per_token = 4.0
@@ -81,20 +179,21 @@ class ContentChunker:
                         end = start + last_sep + len(sep)
                         break
 
-            chunk_text = content[start:end].strip()
-            if chunk_text:
-                chunks.append(ContentChunk(
-                    index=index,
-                    content=chunk_text,
-                    char_start=start,
-                    char_end=end,
-                    token_count_estimate=self.count_tokens(chunk_text),
-                ))
-                index += 1
+            # Trim whitespace by moving the bounds, then slice once;
+            # avoids allocating an unstripped intermediate per chunk
+            s, e = start, end
+            while s < e and content[s].isspace():
+                s += 1
+            while e > s and content[e - 1].isspace():
+                e -= 1
+            if e > s:
+                texts.append(content[s:e])
+                starts.append(s)
+                ends.append(e)
 
             start = end - self.overlap if self.overlap and end < len(content) else end
 
-        return chunks
+        return self._materialize(texts, starts, ends)
 
     def _structure_aware_chunk(self, content: str) -> list[ContentChunk]:
         """Chunk respecting document/code structure.
@@ -107,8 +206,19 @@ class ContentChunker:
         struct_buffer: list[str] = []
         struct_tokens = 0
 
+        # One multiline pass finds every heading up front; the per-line
+        # heading test below is then a set lookup instead of a second
+        # regex match for every line
+        heading_starts = {m.start() for m in self.heading_pattern.finditer(content)}
+
+        offset = 0
         for line in content.splitlines(keepends=True):
-            line_tokens = self.count_tokens(line)
+            line_start = offset
+            offset += len(line)
+            # Budgeting only steers split positions; the cheap estimator
+            # is accurate enough for that and keeps custom counters off
+            # the per-line path
+            line_tokens = estimate_tokens(line)
 
             # Handle oversized lines by splitting them
             if line_tokens > self.chunk_size:
@@ -133,8 +243,8 @@ class ContentChunker:
                 continue
 
             # Check if this is a structure boundary
-            is_struct = bool(
-                self.struct_pattern.match(line) or self.heading_pattern.match(line)
+            is_struct = line_start in heading_starts or bool(
+                self.struct_pattern.match(line)
             )
 
             if is_struct:
@@ -177,22 +287,22 @@ class ContentChunker:
         if current_chunk:
             chunks_text.append("".join(current_chunk))
 
-        # Convert to ContentChunk objects
-        result = []
+        # Convert to ContentChunk objects at the boundary
+        texts: list[str] = []
+        starts: list[int] = []
+        ends: list[int] = []
         char_offset = 0
-        chunk_index = 0
         for raw_text in chunks_text:
             original_len = len(raw_text)
-            stripped = raw_text.strip()
-            if stripped:
-                result.append(ContentChunk(
-                    index=chunk_index,
-                    content=stripped,
-                    char_start=char_offset,
-                    char_end=char_offset + original_len,
-                    token_count_estimate=self.count_tokens(stripped),
-                ))
-                chunk_index += 1
+            s, e = 0, original_len
+            while s < e and raw_text[s].isspace():
+                s += 1
+            while e > s and raw_text[e - 1].isspace():
+                e -= 1
+            if e > s:
+                texts.append(raw_text[s:e])
+                starts.append(char_offset + s)
+                ends.append(char_offset + e)
             char_offset += original_len
 
-        return result
+        return self._materialize(texts, starts, ends)
@@ -0,0 +1,82 @@
+"""Numba-accelerated chunk boundary scanning.
+
+``ExtractionResult.get_chunks`` walks the content window by window,
+running five separator searches per window; on multi-MB documents that
+is a CPU-bound loop. When the optional ``numba`` package is installed,
+the whole scan runs as one JIT-compiled pass over the ASCII byte buffer
+and returns the (start, end) boundary arrays; the caller materializes
+chunk objects only for the final boundaries. Callers import
+:data:`find_chunk_boundaries`, which is ``None`` when numba is
+unavailable.
+"""
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    find_chunk_boundaries = None
+else:
+
+    @numba.njit(cache=True)
+    def _scan(buf, chunk_size, overlap):  # pragma: no cover - jit body
+        n = buf.size
+        half = chunk_size // 2
+        cap = 16
+        starts = np.empty(cap, np.int64)
+        ends = np.empty(cap, np.int64)
+        count = 0
+        start = 0
+        while start < n:
+            end = start + chunk_size
+            if end > n:
+                end = n
+
+            if end < n:
+                # Separators in priority order, mirroring get_chunks:
+                # '. ', '.\n', '\n\n', '\n', ' '
+                found = -1
+                for s in range(5):
+                    if s == 0:
+                        a, b = 46, 32
+                    elif s == 1:
+                        a, b = 46, 10
+                    elif s == 2:
+                        a, b = 10, 10
+                    elif s == 3:
+                        a, b = 10, -1
+                    else:
+                        a, b = 32, -1
+                    seplen = 1 if b < 0 else 2
+                    j = end - seplen
+                    while j >= start:
+                        if buf[j] == a and (b < 0 or buf[j + 1] == b):
+                            break
+                        j -= 1
+                    if j - start > half:
+                        found = j + seplen
+                        break
+                if found >= 0:
+                    end = found
+
+            if count == cap:
+                cap *= 2
+                new_starts = np.empty(cap, np.int64)
+                new_starts[:count] = starts
+                starts = new_starts
+                new_ends = np.empty(cap, np.int64)
+                new_ends[:count] = ends
+                ends = new_ends
+            starts[count] = start
+            ends[count] = end
+            count += 1
+
+            start = end - overlap if overlap != 0 and end < n else end
+
+        return starts[:count], ends[:count]
+
+    def find_chunk_boundaries(
+        data: bytes, chunk_size: int, overlap: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Chunk (start, end) boundary arrays for an ASCII byte buffer."""
+        return _scan(np.frombuffer(data, dtype=np.uint8), chunk_size, overlap)
@@ -7,9 +7,25 @@ Licensed under the Apache License, Version 2.0
 from __future__ import annotations
 
 import functools
+import importlib.util
 from typing import Any, Callable
 
 
+@functools.cache
+def _missing_packages(packages: tuple[str, ...]) -> tuple[str, ...]:
+    """Which of the given packages are not installed, cached.
+
+    find_spec probes the import system without executing the package,
+    and the cache means each distinct dependency set is checked once
+    per process rather than on every wrapped call.
+    """
+    return tuple(
+        package
+        for package in packages
+        if importlib.util.find_spec(package.replace("-", "_")) is None
+    )
+
+
 def dependencies_required(*packages: str) -> Callable:
     """Decorator to check if required packages are installed.
 
@@ -26,12 +42,7 @@ def dependencies_required(*packages: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            missing = []
-            for package in packages:
-                try:
-                    __import__(package.replace("-", "_"))
-                except ImportError:
-                    missing.append(package)
+            missing = _missing_packages(packages)
             if missing:
                 raise ImportError(
                     f"Required packages not installed: {', '.join(missing)}. "
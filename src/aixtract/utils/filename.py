@@ -7,6 +7,17 @@ Licensed under the Apache License, Version 2.0
 from __future__ import annotations
 
 import re
+import string
+
+_UNSAFE_RE = re.compile(r'[^\w\-_. ]')
+
+# Every byte outside the safe set maps to '_'; bytes.translate is a
+# straight 256-entry table lookup per byte, with no per-codepoint dict
+# lookups or regex state machine
+_SAFE_ASCII = set(string.ascii_letters + string.digits + '_-. ')
+_SANITIZE_TABLE = bytes(
+    i if chr(i) in _SAFE_ASCII else ord('_') for i in range(256)
+)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -18,4 +29,7 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for filesystem use.
     """
-    return re.sub(r'[^\w\-_. ]', '_', filename)
+    if filename.isascii():
+        return filename.encode('ascii').translate(_SANITIZE_TABLE).decode('ascii')
+    # Non-ASCII names need the regex: \w keeps Unicode word characters
+    return _UNSAFE_RE.sub('_', filename)
@@ -6,6 +6,7 @@ Licensed under the Apache License, Version 2.0
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import sys
@@ -29,9 +30,13 @@ def _configure_library_logging() -> None:
     _logger.setLevel(logging.WARNING)
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name, prefixed with 'aixtract.'.
 
+    Loggers are singletons, so repeat lookups are served from the cache
+    without taking logging's manager lock.
+
     Args:
         name: The name to append to 'aixtract.'.
 
@@ -51,6 +56,17 @@ def set_log_level(level: str | int) -> None:
     for handler in _logger.handlers:
         handler.setLevel(level)
 
+    # Snapshot the child loggers first (list() of the dict is atomic
+    # under the GIL), then apply levels without holding logging's
+    # manager lock so concurrent get_logger calls are never blocked
+    children = [
+        logger
+        for name, logger in list(logging.Logger.manager.loggerDict.items())
+        if name.startswith("aixtract.") and isinstance(logger, logging.Logger)
+    ]
+    for logger in children:
+        logger.setLevel(level)
+
 
 if os.environ.get("AIXTRACT_LOGGING_DISABLED", "false").lower() != "true":
     _configure_library_logging()
@@ -3,33 +3,57 @@ from __future__ import annotations
 
 import re
 
+# Matches both \r\n and bare \r so line endings normalize in one pass
+_LINE_ENDING_RE = re.compile(r'\r\n?')
+_NEWLINE_RUN_RE = re.compile(r'\n{3,}')
+
+# Per-line whitespace normalization, run entirely in the regex engine.
+# Lines indented four spaces or a tab (code blocks) are left alone:
+# leading whitespace is removed from other lines first, after which any
+# line still starting with whitespace is code and skips the trailing
+# strip too. [^\S\n] is "whitespace except newline", matching what
+# line.strip() removed (NBSP, form feeds, etc.), not just space/tab.
+_LEADING_WS_RE = re.compile(r'(?m)^(?!    |\t)[^\S\n]+')
+_TRAILING_WS_RE = re.compile(r'(?m)^((?![^\S\n]).*?)[^\S\n]+$')
+
+# One C-level pass over the string; each special character maps to its
+# backslash-escaped form
+_ESCAPE_TABLE = str.maketrans(
+    {c: '\\' + c for c in '\\`*_{}[]()#+-.!|'}
+)
+# Membership probe for the same character class; a search that misses
+# costs one C scan and lets clean text skip the translate copy
+_ESCAPE_NEEDED_RE = re.compile(r'[\\`*_{}\[\]()#+\-.!|]')
+
+# Alignment markers for table separator rows
+_ALIGN_MAP = {'left': ':---', 'center': ':---:', 'right': '---:'}
+
+# Heading prefixes for levels 1-6, built once
+_HEADING_PREFIXES = ('# ', '## ', '### ', '#### ', '##### ', '###### ')
+
 
 def clean_markdown(text: str) -> str:
     """Clean and normalize markdown text."""
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Normalize line endings (cheap substring probe before the scan)
+    if '\r' in text:
+        text = _LINE_ENDING_RE.sub('\n', text)
 
     # Remove excessive blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '\n\n\n' in text:
+        text = _NEWLINE_RUN_RE.sub('\n\n', text)
 
-    # Normalize whitespace
-    lines = []
-    for line in text.split('\n'):
-        # Preserve intentional indentation (code blocks)
-        if line.startswith('    ') or line.startswith('\t'):
-            lines.append(line)
-        else:
-            lines.append(line.strip())
+    # Normalize per-line whitespace, preserving code-block indentation
+    text = _LEADING_WS_RE.sub('', text)
+    text = _TRAILING_WS_RE.sub(r'\1', text)
 
-    return '\n'.join(lines).strip()
+    return text.strip()
 
 
 def escape_markdown(text: str) -> str:
     """Escape special markdown characters."""
-    chars_to_escape = ['\\', '`', '*', '_', '{', '}', '[', ']', '(', ')', '#', '+', '-', '.', '!', '|']
-    for char in chars_to_escape:
-        text = text.replace(char, '\\' + char)
-    return text
+    if _ESCAPE_NEEDED_RE.search(text) is None:
+        return text
+    return text.translate(_ESCAPE_TABLE)
 
 
 def table_to_markdown(
@@ -47,21 +71,23 @@ def table_to_markdown(
     if not headers:
         return ""
 
-    alignment = alignment or ['left'] * len(headers)
-
-    # Build alignment markers
-    align_map = {'left': ':---', 'center': ':---:', 'right': '---:'}
-    align_row = [align_map.get(a, '---') for a in alignment]
+    n_cols = len(headers)
+    alignment = alignment or ['left'] * n_cols
+    align_row = [_ALIGN_MAP.get(a, '---') for a in alignment]
 
+    # One joined string per row, one join overall: O(rows) allocations
     lines = [
         '| ' + ' | '.join(headers) + ' |',
         '| ' + ' | '.join(align_row) + ' |',
     ]
-
-    for row in rows:
-        # Pad row if needed
-        padded = row + [''] * (len(headers) - len(row))
-        lines.append('| ' + ' | '.join(str(cell) for cell in padded) + ' |')
+    lines.extend(
+        '| '
+        + ' | '.join(
+            [str(cell) for cell in row] + [''] * (n_cols - len(row))
+        )
+        + ' |'
+        for row in rows
+    )
 
     return '\n'.join(lines)
 
@@ -73,5 +99,4 @@ def code_block(code: str, language: str = "") -> str:
 
 def heading(text: str, level: int = 1) -> str:
     """Create markdown heading."""
-    level = max(1, min(6, level))
-    return '#' * level + ' ' + text
+    return _HEADING_PREFIXES[0 if level < 1 else 5 if level > 6 else level - 1] + text
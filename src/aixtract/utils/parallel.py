@@ -7,43 +7,118 @@ Licensed under the Apache License, Version 2.0
 """
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Iterator, TypeVar
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from typing import Any, Callable, Iterator, Literal, NamedTuple, TypeVar
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
+class BatchResult(NamedTuple):
+    """Materialized batch output as three parallel arrays.
+
+    Unlike ``dict(process_batch(...))`` this keeps positional access,
+    works with unhashable items, and stores failures as indices into
+    the arrays.
+    """
+
+    items: list
+    results: list
+    failures: list[int]
+
+    def as_dict(self) -> dict:
+        """Item -> result mapping, for hashable items."""
+        return dict(zip(self.items, self.results, strict=True))
+
+
+def _apply(args: tuple[Callable, Any]) -> tuple[Any, Any, Exception | None]:
+    """Pool worker; returns (item, result, error) so failures survive
+    the trip back without killing the pool iteration and results can be
+    matched to their items regardless of completion order."""
+    processor, item = args
+    try:
+        return item, processor(item), None
+    except Exception as e:
+        return item, None, e
+
+
 def process_batch(
     items: list[T],
     processor: Callable[[T], R],
     max_workers: int = 4,
     skip_failed: bool = False,
+    mode: Literal["thread", "process"] = "thread",
 ) -> Iterator[tuple[T, R | Exception]]:
-    """Process items in parallel using ThreadPoolExecutor.
+    """Process items in parallel.
 
     Pattern adapted from CAMEL MarkItDownLoader.convert_files().
 
+    Both modes stream results through ``imap_unordered``, which hands
+    work to idle workers in chunks and yields as results arrive with no
+    per-item Future allocation; completion order is not guaranteed.
+
     Args:
         items: Items to process.
         processor: Function to apply to each item.
         max_workers: Maximum concurrent workers.
         skip_failed: If True, skip failed items silently.
+        mode: "thread" (default; works with any callable) or "process"
+            for CPU-bound work that would serialize behind the GIL.
+            Process mode requires a picklable processor and items.
 
     Yields:
         Tuples of (item, result_or_exception).
     """
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(processor, item): item
-            for item in items
-        }
-
-        for future in as_completed(futures):
-            item = futures[future]
-            try:
-                result = future.result()
-                yield item, result
-            except Exception as e:
+    chunksize = max(1, len(items) // (4 * max_workers))
+    pool = (
+        ThreadPool(max_workers)
+        if mode == "thread"
+        else multiprocessing.Pool(max_workers)
+    )
+    with pool:
+        results = pool.imap_unordered(
+            _apply,
+            [(processor, item) for item in items],
+            chunksize,
+        )
+        for item, result, error in results:
+            if error is not None:
                 if not skip_failed:
-                    yield item, e
+                    yield item, error
+            else:
+                yield item, result
+
+
+def process_batch_all(
+    items: list[T],
+    processor: Callable[[T], R],
+    max_workers: int = 4,
+    mode: Literal["thread", "process"] = "thread",
+) -> BatchResult:
+    """Process items in parallel and collect everything up front.
+
+    Convenience wrapper over :func:`process_batch` for callers that
+    want the whole batch rather than a stream; failed items keep their
+    exception in ``results`` and are listed by index in ``failures``.
+
+    Args:
+        items: Items to process.
+        processor: Function to apply to each item.
+        max_workers: Maximum concurrent workers.
+        mode: Passed through to :func:`process_batch`.
+
+    Returns:
+        BatchResult with items, results and failure indices as
+        parallel arrays.
+    """
+    items_out: list = []
+    results: list = []
+    failures: list[int] = []
+    stream = process_batch(items, processor, max_workers=max_workers, mode=mode)
+    for i, (item, result) in enumerate(stream):
+        items_out.append(item)
+        results.append(result)
+        if isinstance(result, Exception):
+            failures.append(i)
+    return BatchResult(items_out, results, failures)
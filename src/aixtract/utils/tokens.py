@@ -7,6 +7,22 @@ Licensed under the Apache License, Version 2.0
 """
 from __future__ import annotations
 
+import mmap
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_WORD_RE = re.compile(r"\S+")
+
+# Below this size the vectorized word count isn't worth the encode
+_NUMPY_MIN_CHARS = 4096
+
 # Approximate characters per token for different encodings
 CHARS_PER_TOKEN = {
     "cl100k_base": 4.0,
@@ -17,6 +33,42 @@ CHARS_PER_TOKEN = {
     "default": 4.0,
 }
 
+# Split separators in preference order; the lookahead keeps overlapping
+# occurrences (e.g. both positions inside "\n\n\n") like rfind would
+_SPLIT_SEPARATORS = [
+    (re.compile("(?=" + re.escape(sep) + ")"), len(sep))
+    for sep in (". ", ".\n", "\n\n", "\n", " ")
+]
+_SPLIT_SEPARATOR_BYTES = (b". ", b".\n", b"\n\n", b"\n", b" ")
+
+# Constant-folded multipliers for the blended estimate:
+# (chars / cpt + words * 1.3) / 2 == chars * (0.5 / cpt) + words * 0.65
+_CHAR_FACTOR = {enc: 0.5 / cpt for enc, cpt in CHARS_PER_TOKEN.items()}
+
+
+def _count_words(text: str) -> int:
+    """Word count without materializing the split list.
+
+    Large ASCII texts are counted as whitespace-to-word transitions over
+    the byte buffer in one vectorized numpy pass; everything else falls
+    back to the regex scan, which handles Unicode whitespace.
+    """
+    if np is not None and len(text) >= _NUMPY_MIN_CHARS and text.isascii():
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        # ASCII \s: \t-\r, space, and the FS/GS/RS/US separators
+        space = (
+            ((buf >= 0x09) & (buf <= 0x0D))
+            | (buf == 0x20)
+            | ((buf >= 0x1C) & (buf <= 0x1F))
+        )
+        word = ~space
+        count = int(np.count_nonzero(word[1:] & space[:-1]))
+        if word[0]:
+            count += 1
+        return count
+
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 
 def estimate_tokens(
     text: str,
@@ -36,14 +88,8 @@ def estimate_tokens(
     if not text:
         return 0
 
-    chars_per_token = CHARS_PER_TOKEN.get(encoding, 4.0)
-    char_count = len(text)
-    word_count = len(text.split())
-
-    char_estimate = char_count / chars_per_token
-    word_estimate = word_count * 1.3
-
-    return int((char_estimate + word_estimate) / 2)
+    char_factor = _CHAR_FACTOR.get(encoding, 0.125)
+    return int(len(text) * char_factor + _count_words(text) * 0.65)
 
 
 def count_tokens_tiktoken(text: str, model: str = "gpt-4") -> int:
@@ -59,21 +105,79 @@ def count_tokens_tiktoken(text: str, model: str = "gpt-4") -> int:
         Exact token count, or estimate if tiktoken unavailable.
     """
     try:
-        import tiktoken
-
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            if "o1" in model or "o3" in model:
-                encoding = tiktoken.get_encoding("o200k_base")
-            else:
-                encoding = tiktoken.get_encoding("cl100k_base")
-
+        encoding = _shared_encoding(model)
         return len(encoding.encode(text, disallowed_special=()))
     except ImportError:
         return estimate_tokens(text)
 
 
+def count_tokens_batch(texts: list[str], model: str = "gpt-4") -> list[int]:
+    """Count tokens for many texts in one tiktoken call.
+
+    encode_batch crosses the FFI boundary once and tokenizes on
+    tiktoken's internal thread pool, so per-text overhead is amortized
+    across the batch. Falls back to per-text estimates if tiktoken is
+    unavailable.
+
+    Args:
+        texts: Texts to count.
+        model: Model name for encoding selection.
+
+    Returns:
+        Token counts, one per input text.
+    """
+    if not texts:
+        return []
+
+    try:
+        encoding = _shared_encoding(model)
+        return [
+            len(ids)
+            for ids in encoding.encode_batch(texts, disallowed_special=())
+        ]
+    except ImportError:
+        return [estimate_tokens(text) for text in texts]
+
+
+# Shared Encoding for the default model; tiktoken Encodings are
+# thread-safe, so one instance serves every caller
+_DEFAULT_MODEL = "gpt-4"
+_default_encoding = None
+
+
+def _shared_encoding(model: str):
+    """Encoding for the given model, with a global fast path.
+
+    The default model skips even the lru_cache machinery (hashing plus a
+    wrapped call) on the innermost counting path; other models go
+    through the cached resolver.
+    """
+    global _default_encoding
+    if model == _DEFAULT_MODEL:
+        if _default_encoding is None:
+            _default_encoding = _get_model_encoding(model)
+        return _default_encoding
+    return _get_model_encoding(model)
+
+
+@lru_cache(maxsize=16)
+def _get_model_encoding(model: str):
+    """Resolve a model name to its tiktoken Encoding, cached.
+
+    Building an Encoding costs ~100ms; repeat counts for the same model
+    hit the cache instead. Failed lookups are not cached, so a missing
+    tiktoken keeps raising ImportError for the caller's fallback.
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        if "o1" in model or "o3" in model:
+            return tiktoken.get_encoding("o200k_base")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def split_by_tokens(
     text: str,
     max_tokens: int,
@@ -97,6 +201,18 @@ def split_by_tokens(
     chars_per_token = CHARS_PER_TOKEN.get(encoding, 4.0)
     max_chars = int(max_tokens * chars_per_token)
     overlap_chars = int(overlap_tokens * chars_per_token)
+    # An overlap at or beyond the chunk span would defeat the
+    # forward-progress guard below and degrade into one-char steps
+    # (quadratic output); bound it to half the chunk
+    if overlap_chars >= max_chars:
+        overlap_chars = max_chars // 2
+
+    # All separator positions in one pass each; boundary searches below
+    # are then bisects instead of rfind scans over every window
+    sep_positions = [
+        ([m.start() for m in pattern.finditer(text)], sep_len)
+        for pattern, sep_len in _SPLIT_SEPARATORS
+    ]
 
     chunks = []
     start = 0
@@ -105,10 +221,10 @@ def split_by_tokens(
         end = min(start + max_chars, len(text))
 
         if end < len(text):
-            for sep in [". ", ".\n", "\n\n", "\n", " "]:
-                last_sep = text[start:end].rfind(sep)
-                if last_sep > max_chars // 2:
-                    end = start + last_sep + len(sep)
+            for positions, sep_len in sep_positions:
+                i = bisect_right(positions, end - sep_len) - 1
+                if i >= 0 and positions[i] - start > max_chars // 2:
+                    end = positions[i] + sep_len
                     break
 
         chunk = text[start:end].strip()
@@ -120,3 +236,71 @@ def split_by_tokens(
         start = max(new_start, start + 1)
 
     return chunks
+
+
+def split_file_by_tokens(
+    path: str | Path,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    encoding: str = "default",
+) -> list[str]:
+    """Split a file into chunks by estimated token count via mmap.
+
+    The file is memory-mapped and sliced in place, so the full text is
+    never materialized as one str; only the returned chunks are decoded.
+    The split separators are ASCII, which never occurs inside a UTF-8
+    multi-byte sequence, so searching the raw bytes is safe; stride
+    boundaries that land mid-sequence are nudged back to a character
+    boundary.
+
+    Args:
+        path: File to split (assumed UTF-8).
+        max_tokens: Maximum tokens per chunk.
+        overlap_tokens: Overlap between chunks.
+        encoding: Encoding for estimation.
+
+    Returns:
+        List of text chunks.
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:  # mmap rejects empty files
+            return []
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            chars_per_token = CHARS_PER_TOKEN.get(encoding, 4.0)
+            max_chars = int(max_tokens * chars_per_token)
+            overlap_chars = int(overlap_tokens * chars_per_token)
+            if overlap_chars >= max_chars:
+                overlap_chars = max_chars // 2
+
+            n = len(mm)
+            chunks = []
+            start = 0
+
+            while start < n:
+                end = min(start + max_chars, n)
+
+                if end < n:
+                    for sep in _SPLIT_SEPARATOR_BYTES:
+                        last_sep = mm.rfind(sep, start, end)
+                        if last_sep - start > max_chars // 2:
+                            end = last_sep + len(sep)
+                            break
+                    else:
+                        # Back off a raw stride cut to a UTF-8 boundary
+                        while end > start and mm[end] & 0xC0 == 0x80:
+                            end -= 1
+
+                chunk = mm[start:end].decode("utf-8", "replace").strip()
+                if chunk:
+                    chunks.append(chunk)
+
+                new_start = end - overlap_chars if overlap_chars else end
+                start = max(new_start, start + 1)
+                # Overlap starts can also land inside a multi-byte char
+                while start < n and mm[start] & 0xC0 == 0x80:
+                    start += 1
+
+            return chunks
+        finally:
+            mm.close()
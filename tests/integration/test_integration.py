@@ -356,6 +356,25 @@ class TestEngineExtractBatch:
             assert "Batch document" in result.content
 
 
+class TestEngineExtractMany:
+    """Verify process-parallel extraction with extract_many."""
+
+    def test_engine_extract_many(self, tmp_path: Path) -> None:
+        files = []
+        for i in range(3):
+            p = tmp_path / f"many_{i}.txt"
+            p.write_text(f"Many document number {i} content.")
+            files.append(p)
+
+        engine = ExtractionEngine()
+        results = engine.extract_many(files)
+
+        assert len(results) == 3
+        for i, result in enumerate(results):
+            assert result.success is True
+            assert f"number {i}" in result.content
+
+
 # ---------------------------------------------------------------------------
 # 14. test_config_for_llm_preset
 # ---------------------------------------------------------------------------
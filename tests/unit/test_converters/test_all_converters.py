@@ -25,7 +25,20 @@ from typing import BinaryIO, ClassVar
 
 import pytest
 
+from aixtract.converters.archive import ZIPConverter
 from aixtract.converters.base import BaseConverter
+from aixtract.converters.docx import DOCXConverter
+from aixtract.converters.html import HTMLConverter
+from aixtract.converters.pdf import PDFConverter
+from aixtract.converters.pptx import PPTXConverter
+from aixtract.converters.text import (
+    CSVConverter,
+    JSONConverter,
+    TXTConverter,
+    XMLConverter,
+)
+from aixtract.converters.xlsx import XLSXConverter
+from aixtract.core.registry import ConverterRegistry
 from aixtract.models.config import ExtractionConfig
 from aixtract.models.result import DocumentMetadata, ExtractionResult
 
@@ -147,8 +160,6 @@ class TestTXTConverter:
 
     def test_extract_from_file_path(self, config: ExtractionConfig, tmp_path: Path):
         """Extract text from a .txt file path."""
-        from aixtract.converters.text import TXTConverter
-
         text_file = tmp_path / "hello.txt"
         text_file.write_text("Hello, World!\nThis is a test document.", encoding="utf-8")
 
@@ -163,8 +174,6 @@ class TestTXTConverter:
 
     def test_extract_from_bytes(self, config: ExtractionConfig):
         """Extract text from raw bytes."""
-        from aixtract.converters.text import TXTConverter
-
         raw = b"Bytes content here."
         converter = TXTConverter(config)
         result = converter.extract(raw, filename="from_bytes.txt")
@@ -174,8 +183,6 @@ class TestTXTConverter:
 
     def test_extract_from_binary_io(self, config: ExtractionConfig):
         """Extract text from a BinaryIO (BytesIO) stream."""
-        from aixtract.converters.text import TXTConverter
-
         bio = io.BytesIO(b"Streamed text content.")
         converter = TXTConverter(config)
         result = converter.extract(bio, filename="stream.txt")
@@ -185,8 +192,6 @@ class TestTXTConverter:
 
     def test_strips_consecutive_newlines(self, config: ExtractionConfig):
         """Consecutive blank lines (3+) are collapsed to double."""
-        from aixtract.converters.text import TXTConverter
-
         raw = b"Line one.\n\n\n\nLine two."
         converter = TXTConverter(config)
         result = converter.extract(raw, filename="multi_newline.txt")
@@ -201,8 +206,6 @@ class TestTXTConverter:
 
     def test_word_and_char_count_in_metadata(self, config: ExtractionConfig):
         """Metadata includes word_count and char_count."""
-        from aixtract.converters.text import TXTConverter
-
         raw = b"One two three four five."
         converter = TXTConverter(config)
         result = converter.extract(raw, filename="count.txt")
@@ -214,8 +217,6 @@ class TestTXTConverter:
 
     def test_can_handle_extensions(self):
         """TXTConverter handles .txt, .md, .rst, .log."""
-        from aixtract.converters.text import TXTConverter
-
         for ext in ("txt", "md", "rst", "log"):
             assert TXTConverter.can_handle(ext) is True
         assert TXTConverter.can_handle("pdf") is False
@@ -233,8 +234,6 @@ class TestCSVConverter:
         self, config: ExtractionConfig, tmp_path: Path
     ):
         """Extract a CSV with headers and data rows."""
-        from aixtract.converters.text import CSVConverter
-
         csv_content = "Name,Age,City\nAlice,30,New York\nBob,25,London\n"
         csv_file = tmp_path / "people.csv"
         csv_file.write_text(csv_content, encoding="utf-8")
@@ -248,8 +247,6 @@ class TestCSVConverter:
 
     def test_creates_proper_markdown_table(self, config: ExtractionConfig):
         """Content markdown contains a well-formed markdown table."""
-        from aixtract.converters.text import CSVConverter
-
         csv_bytes = b"Name,Age\nAlice,30\nBob,25\n"
         converter = CSVConverter(config)
         result = converter.extract(csv_bytes, filename="test.csv")
@@ -262,8 +259,6 @@ class TestCSVConverter:
 
     def test_handles_empty_csv(self, config: ExtractionConfig):
         """An empty CSV returns success with empty content."""
-        from aixtract.converters.text import CSVConverter
-
         converter = CSVConverter(config)
         result = converter.extract(b"", filename="empty.csv")
 
@@ -272,8 +267,6 @@ class TestCSVConverter:
 
     def test_row_count_and_column_count_in_metadata(self, config: ExtractionConfig):
         """Metadata extra dict contains row_count and column_count."""
-        from aixtract.converters.text import CSVConverter
-
         csv_bytes = b"A,B,C\n1,2,3\n4,5,6\n"
         converter = CSVConverter(config)
         result = converter.extract(csv_bytes, filename="nums.csv")
@@ -283,8 +276,6 @@ class TestCSVConverter:
 
     def test_can_handle_extensions(self):
         """CSVConverter handles .csv and .tsv."""
-        from aixtract.converters.text import CSVConverter
-
         assert CSVConverter.can_handle("csv") is True
         assert CSVConverter.can_handle("tsv") is True
         assert CSVConverter.can_handle("xlsx") is False
@@ -300,8 +291,6 @@ class TestJSONConverter:
 
     def test_extract_json_file(self, config: ExtractionConfig, tmp_path: Path):
         """Extract from a .json file."""
-        from aixtract.converters.text import JSONConverter
-
         data = {"name": "Alice", "scores": [95, 88, 72]}
         json_file = tmp_path / "data.json"
         json_file.write_text(json.dumps(data), encoding="utf-8")
@@ -315,8 +304,6 @@ class TestJSONConverter:
 
     def test_content_json_is_populated(self, config: ExtractionConfig):
         """content_json field is set with the parsed data."""
-        from aixtract.converters.text import JSONConverter
-
         data = {"key": "value", "nested": {"a": 1}}
         converter = JSONConverter(config)
         result = converter.extract(json.dumps(data).encode(), filename="test.json")
@@ -327,8 +314,6 @@ class TestJSONConverter:
 
     def test_content_json_wraps_list(self, config: ExtractionConfig):
         """A JSON array is wrapped under a 'data' key in content_json."""
-        from aixtract.converters.text import JSONConverter
-
         data = [1, 2, 3]
         converter = JSONConverter(config)
         result = converter.extract(json.dumps(data).encode(), filename="list.json")
@@ -338,8 +323,6 @@ class TestJSONConverter:
 
     def test_formatted_json_in_content(self, config: ExtractionConfig):
         """content contains pretty-printed JSON."""
-        from aixtract.converters.text import JSONConverter
-
         data = {"a": 1}
         converter = JSONConverter(config)
         result = converter.extract(json.dumps(data).encode(), filename="fmt.json")
@@ -350,8 +333,6 @@ class TestJSONConverter:
 
     def test_can_handle_extensions(self):
         """JSONConverter handles .json only."""
-        from aixtract.converters.text import JSONConverter
-
         assert JSONConverter.can_handle("json") is True
         assert JSONConverter.can_handle("xml") is False
 
@@ -366,8 +347,6 @@ class TestXMLConverter:
 
     def test_extract_text_from_nested_xml(self, config: ExtractionConfig):
         """Extracts text from nested XML elements."""
-        from aixtract.converters.text import XMLConverter
-
         xml_bytes = b"""<?xml version="1.0"?>
         <catalog>
             <book>
@@ -392,8 +371,6 @@ class TestXMLConverter:
 
     def test_handles_attributes_and_tail_text(self, config: ExtractionConfig):
         """Handles element tail text correctly."""
-        from aixtract.converters.text import XMLConverter
-
         xml_bytes = b"""<root>
             <item id="1">First</item> after first
             <item id="2">Second</item> after second
@@ -410,8 +387,6 @@ class TestXMLConverter:
 
     def test_xml_in_markdown_code_fence(self, config: ExtractionConfig):
         """Markdown content wraps original XML in a code fence."""
-        from aixtract.converters.text import XMLConverter
-
         xml_bytes = b"<root><item>hello</item></root>"
         converter = XMLConverter(config)
         result = converter.extract(xml_bytes, filename="simple.xml")
@@ -420,8 +395,6 @@ class TestXMLConverter:
 
     def test_can_handle_extensions(self):
         """XMLConverter handles .xml only."""
-        from aixtract.converters.text import XMLConverter
-
         assert XMLConverter.can_handle("xml") is True
         assert XMLConverter.can_handle("html") is False
 
@@ -431,25 +404,26 @@ class TestXMLConverter:
 # ===========================================================================
 
 
-class TestZIPConverter:
-    """Tests for ZIP archive extraction."""
+@pytest.fixture(scope="session")
+def zip_factory(tmp_path_factory: pytest.TempPathFactory):
+    """Session-scoped factory creating ZIP archives in a shared temp dir."""
 
-    def _make_zip(self, tmp_path: Path, files: dict[str, bytes]) -> Path:
-        """Helper: create a ZIP with the given filename->content mapping."""
-        zip_path = tmp_path / "archive.zip"
+    def make(files: dict[str, bytes]) -> Path:
+        zip_path = tmp_path_factory.mktemp("zips") / "archive.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
             for name, data in files.items():
                 zf.writestr(name, data)
         return zip_path
 
-    def test_extract_zip_with_text_files(
-        self, config: ExtractionConfig, tmp_path: Path
-    ):
-        """Extract text content from files inside a ZIP."""
-        from aixtract.converters.archive import ZIPConverter
+    return make
 
-        zip_path = self._make_zip(
-            tmp_path,
+
+class TestZIPConverter:
+    """Tests for ZIP archive extraction."""
+
+    def test_extract_zip_with_text_files(self, config: ExtractionConfig, zip_factory):
+        """Extract text content from files inside a ZIP."""
+        zip_path = zip_factory(
             {
                 "readme.txt": b"Hello from readme",
                 "notes.md": b"# Notes\nSome markdown content",
@@ -463,12 +437,9 @@ class TestZIPConverter:
         assert "Hello from readme" in result.content
         assert "Some markdown content" in result.content
 
-    def test_lists_files_in_archive(self, config: ExtractionConfig, tmp_path: Path):
+    def test_lists_files_in_archive(self, config: ExtractionConfig, zip_factory):
         """Markdown output lists each file as a section."""
-        from aixtract.converters.archive import ZIPConverter
-
-        zip_path = self._make_zip(
-            tmp_path,
+        zip_path = zip_factory(
             {"a.txt": b"aaa", "b.txt": b"bbb"},
         )
 
@@ -478,12 +449,9 @@ class TestZIPConverter:
         assert "a.txt" in result.content_markdown
         assert "b.txt" in result.content_markdown
 
-    def test_file_count_in_metadata(self, config: ExtractionConfig, tmp_path: Path):
+    def test_file_count_in_metadata(self, config: ExtractionConfig, zip_factory):
         """Metadata extra contains file_count."""
-        from aixtract.converters.archive import ZIPConverter
-
-        zip_path = self._make_zip(
-            tmp_path,
+        zip_path = zip_factory(
             {"one.txt": b"1", "two.txt": b"2", "three.txt": b"3"},
         )
 
@@ -493,12 +461,9 @@ class TestZIPConverter:
         assert result.metadata.extra["file_count"] == 3
         assert len(result.metadata.extra["files"]) == 3
 
-    def test_zip_with_non_text_files(self, config: ExtractionConfig, tmp_path: Path):
+    def test_zip_with_non_text_files(self, config: ExtractionConfig, zip_factory):
         """ZIP with only non-text files shows a listing."""
-        from aixtract.converters.archive import ZIPConverter
-
-        zip_path = self._make_zip(
-            tmp_path,
+        zip_path = zip_factory(
             {"image.png": b"\x89PNG\r\n", "data.bin": b"\x00\x01\x02"},
         )
 
@@ -511,11 +476,9 @@ class TestZIPConverter:
         assert "data.bin" in result.content_markdown
         assert "# Archive Contents" in result.content_markdown
 
-    def test_extract_from_bytes(self, config: ExtractionConfig, tmp_path: Path):
+    def test_extract_from_bytes(self, config: ExtractionConfig, zip_factory):
         """Extract ZIP from raw bytes."""
-        from aixtract.converters.archive import ZIPConverter
-
-        zip_path = self._make_zip(tmp_path, {"test.txt": b"test content"})
+        zip_path = zip_factory({"test.txt": b"test content"})
         zip_bytes = zip_path.read_bytes()
 
         converter = ZIPConverter(config)
@@ -533,6 +496,12 @@ class TestZIPConverter:
 class TestPDFConverter:
     """Tests for PDF extraction."""
 
+    # Skip only this class when the optional library is missing; the
+    # dependency-free converter tests above still run
+    @pytest.fixture(autouse=True)
+    def _requires_pypdf(self):
+        pytest.importorskip("pypdf")
+
     @pytest.fixture
     def minimal_pdf_bytes(self) -> bytes:
         """Create a minimal valid (but empty) PDF using raw bytes."""
@@ -557,10 +526,12 @@ class TestPDFConverter:
             b"%%EOF\n"
         )
 
-    @pytest.fixture
-    def pdf_with_text(self, tmp_path: Path) -> Path:
+    @pytest.fixture(scope="session")
+    def pdf_with_text(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """Create a PDF with actual text content using pypdf."""
-        from pypdf import PdfWriter
+        # Session fixtures set up before the class autouse skip, so
+        # guard the import here as well
+        pypdf = pytest.importorskip("pypdf")
         from pypdf.generic import (
             ArrayObject,
             DictionaryObject,
@@ -569,9 +540,9 @@ class TestPDFConverter:
             TextStringObject,
         )
 
-        writer = PdfWriter()
+        writer = pypdf.PdfWriter()
         writer.add_blank_page(width=612, height=792)
-        pdf_path = tmp_path / "sample.pdf"
+        pdf_path = tmp_path_factory.mktemp("pdf") / "sample.pdf"
         with open(pdf_path, "wb") as f:
             writer.write(f)
         return pdf_path
@@ -580,8 +551,6 @@ class TestPDFConverter:
         self, config: ExtractionConfig, minimal_pdf_bytes: bytes
     ):
         """PDFConverter handles a minimal blank PDF gracefully."""
-        from aixtract.converters.pdf import PDFConverter
-
         converter = PDFConverter(config)
         result = converter.extract(minimal_pdf_bytes, filename="blank.pdf")
 
@@ -593,8 +562,6 @@ class TestPDFConverter:
         self, config: ExtractionConfig, minimal_pdf_bytes: bytes
     ):
         """Metadata includes page_count."""
-        from aixtract.converters.pdf import PDFConverter
-
         converter = PDFConverter(config)
         result = converter.extract(minimal_pdf_bytes, filename="blank.pdf")
 
@@ -605,8 +572,6 @@ class TestPDFConverter:
         self, config: ExtractionConfig, pdf_with_text: Path
     ):
         """PDFConverter extracts from a file path."""
-        from aixtract.converters.pdf import PDFConverter
-
         converter = PDFConverter(config)
         result = converter.extract(pdf_with_text, filename="sample.pdf")
 
@@ -615,24 +580,18 @@ class TestPDFConverter:
 
     def test_can_handle_pdf_extension(self):
         """PDFConverter handles .pdf extension."""
-        from aixtract.converters.pdf import PDFConverter
-
         assert PDFConverter.can_handle("pdf") is True
         assert PDFConverter.can_handle(".pdf") is True
         assert PDFConverter.can_handle("PDF") is True
 
     def test_can_handle_pdf_mimetype(self):
         """PDFConverter handles application/pdf mimetype."""
-        from aixtract.converters.pdf import PDFConverter
-
         assert PDFConverter.can_handle("", mimetype="application/pdf") is True
 
     def test_content_is_string(
         self, config: ExtractionConfig, minimal_pdf_bytes: bytes
     ):
         """Content and content_markdown are strings (even if empty)."""
-        from aixtract.converters.pdf import PDFConverter
-
         converter = PDFConverter(config)
         result = converter.extract(minimal_pdf_bytes, filename="test.pdf")
 
@@ -648,25 +607,27 @@ class TestPDFConverter:
 class TestDOCXConverter:
     """Tests for Word document extraction."""
 
-    @pytest.fixture
-    def sample_docx(self, tmp_path: Path) -> Path:
+    @pytest.fixture(autouse=True)
+    def _requires_docx(self):
+        pytest.importorskip("docx")
+
+    @pytest.fixture(scope="session")
+    def sample_docx(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """Create a minimal .docx with headings and paragraphs."""
-        from docx import Document
+        docx = pytest.importorskip("docx")
 
-        doc = Document()
+        doc = docx.Document()
         doc.add_heading("Test Heading", level=1)
         doc.add_paragraph("This is the first paragraph of test content.")
         doc.add_heading("Second Section", level=2)
         doc.add_paragraph("Another paragraph with more text.")
 
-        docx_path = tmp_path / "sample.docx"
+        docx_path = tmp_path_factory.mktemp("docx") / "sample.docx"
         doc.save(str(docx_path))
         return docx_path
 
     def test_extract_docx(self, config: ExtractionConfig, sample_docx: Path):
         """Extract content from a valid .docx file."""
-        from aixtract.converters.docx import DOCXConverter
-
         converter = DOCXConverter(config)
         result = converter.extract(sample_docx, filename="sample.docx")
 
@@ -676,8 +637,6 @@ class TestDOCXConverter:
 
     def test_headings_detected(self, config: ExtractionConfig, sample_docx: Path):
         """Headings are converted to markdown heading syntax."""
-        from aixtract.converters.docx import DOCXConverter
-
         converter = DOCXConverter(config)
         result = converter.extract(sample_docx, filename="sample.docx")
 
@@ -686,8 +645,6 @@ class TestDOCXConverter:
 
     def test_paragraphs_extracted(self, config: ExtractionConfig, sample_docx: Path):
         """Paragraph text is present in the extracted content."""
-        from aixtract.converters.docx import DOCXConverter
-
         converter = DOCXConverter(config)
         result = converter.extract(sample_docx, filename="sample.docx")
 
@@ -698,8 +655,6 @@ class TestDOCXConverter:
         self, config: ExtractionConfig, sample_docx: Path
     ):
         """Metadata includes word_count and char_count."""
-        from aixtract.converters.docx import DOCXConverter
-
         converter = DOCXConverter(config)
         result = converter.extract(sample_docx, filename="sample.docx")
 
@@ -710,8 +665,6 @@ class TestDOCXConverter:
 
     def test_extract_from_bytes(self, config: ExtractionConfig, sample_docx: Path):
         """Extract DOCX from raw bytes."""
-        from aixtract.converters.docx import DOCXConverter
-
         docx_bytes = sample_docx.read_bytes()
         converter = DOCXConverter(config)
         result = converter.extract(docx_bytes, filename="bytes.docx")
@@ -721,8 +674,6 @@ class TestDOCXConverter:
 
     def test_can_handle_extensions(self):
         """DOCXConverter handles .docx and .doc."""
-        from aixtract.converters.docx import DOCXConverter
-
         assert DOCXConverter.can_handle("docx") is True
         assert DOCXConverter.can_handle("doc") is True
         assert DOCXConverter.can_handle("pdf") is False
@@ -731,8 +682,6 @@ class TestDOCXConverter:
         """Extract a DOCX containing a table."""
         from docx import Document
 
-        from aixtract.converters.docx import DOCXConverter
-
         doc = Document()
         doc.add_paragraph("Table below:")
         table = doc.add_table(rows=3, cols=2)
@@ -763,26 +712,28 @@ class TestDOCXConverter:
 class TestXLSXConverter:
     """Tests for Excel spreadsheet extraction."""
 
-    @pytest.fixture
-    def sample_xlsx(self, tmp_path: Path) -> Path:
+    @pytest.fixture(autouse=True)
+    def _requires_openpyxl(self):
+        pytest.importorskip("openpyxl")
+
+    @pytest.fixture(scope="session")
+    def sample_xlsx(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """Create a minimal .xlsx with data."""
-        from openpyxl import Workbook
+        openpyxl = pytest.importorskip("openpyxl")
 
-        wb = Workbook()
+        wb = openpyxl.Workbook()
         ws = wb.active
         ws.title = "People"
         ws.append(["Name", "Age", "City"])
         ws.append(["Alice", 30, "New York"])
         ws.append(["Bob", 25, "London"])
 
-        xlsx_path = tmp_path / "sample.xlsx"
+        xlsx_path = tmp_path_factory.mktemp("xlsx_samples") / "sample.xlsx"
         wb.save(str(xlsx_path))
         return xlsx_path
 
     def test_extract_xlsx(self, config: ExtractionConfig, sample_xlsx: Path):
         """Extract content from a valid .xlsx file."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         converter = XLSXConverter(config)
         result = converter.extract(sample_xlsx, filename="sample.xlsx")
 
@@ -792,8 +743,6 @@ class TestXLSXConverter:
 
     def test_sheet_names_in_content(self, config: ExtractionConfig, sample_xlsx: Path):
         """Sheet name appears in markdown content."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         converter = XLSXConverter(config)
         result = converter.extract(sample_xlsx, filename="sample.xlsx")
 
@@ -801,8 +750,6 @@ class TestXLSXConverter:
 
     def test_markdown_table_format(self, config: ExtractionConfig, sample_xlsx: Path):
         """Content markdown contains a properly formatted table."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         converter = XLSXConverter(config)
         result = converter.extract(sample_xlsx, filename="sample.xlsx")
 
@@ -816,8 +763,6 @@ class TestXLSXConverter:
         self, config: ExtractionConfig, sample_xlsx: Path
     ):
         """Metadata extra contains sheet info."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         converter = XLSXConverter(config)
         result = converter.extract(sample_xlsx, filename="sample.xlsx")
 
@@ -829,8 +774,6 @@ class TestXLSXConverter:
         """Extract from an XLSX with multiple sheets."""
         from openpyxl import Workbook
 
-        from aixtract.converters.xlsx import XLSXConverter
-
         wb = Workbook()
         ws1 = wb.active
         ws1.title = "Sales"
@@ -854,8 +797,6 @@ class TestXLSXConverter:
 
     def test_extract_from_bytes(self, config: ExtractionConfig, sample_xlsx: Path):
         """Extract XLSX from raw bytes."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         xlsx_bytes = sample_xlsx.read_bytes()
         converter = XLSXConverter(config)
         result = converter.extract(xlsx_bytes, filename="bytes.xlsx")
@@ -865,8 +806,6 @@ class TestXLSXConverter:
 
     def test_can_handle_extensions(self):
         """XLSXConverter handles .xlsx and .xls."""
-        from aixtract.converters.xlsx import XLSXConverter
-
         assert XLSXConverter.can_handle("xlsx") is True
         assert XLSXConverter.can_handle("xls") is True
         assert XLSXConverter.can_handle("csv") is False
@@ -880,12 +819,16 @@ class TestXLSXConverter:
 class TestPPTXConverter:
     """Tests for PowerPoint extraction."""
 
-    @pytest.fixture
-    def sample_pptx(self, tmp_path: Path) -> Path:
+    @pytest.fixture(autouse=True)
+    def _requires_pptx(self):
+        pytest.importorskip("pptx")
+
+    @pytest.fixture(scope="session")
+    def sample_pptx(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """Create a minimal .pptx with slide content."""
-        from pptx import Presentation
+        pptx = pytest.importorskip("pptx")
 
-        prs = Presentation()
+        prs = pptx.Presentation()
         # Use the title and content layout (index 1)
         slide_layout = prs.slide_layouts[1]
         slide = prs.slides.add_slide(slide_layout)
@@ -897,14 +840,12 @@ class TestPPTXConverter:
         slide2.shapes.title.text = "Second Slide"
         slide2.placeholders[1].text = "More content"
 
-        pptx_path = tmp_path / "sample.pptx"
+        pptx_path = tmp_path_factory.mktemp("pptx_samples") / "sample.pptx"
         prs.save(str(pptx_path))
         return pptx_path
 
     def test_extract_pptx(self, config: ExtractionConfig, sample_pptx: Path):
         """Extract content from a valid .pptx file."""
-        from aixtract.converters.pptx import PPTXConverter
-
         converter = PPTXConverter(config)
         result = converter.extract(sample_pptx, filename="sample.pptx")
 
@@ -916,8 +857,6 @@ class TestPPTXConverter:
         self, config: ExtractionConfig, sample_pptx: Path
     ):
         """Slide text is present in extracted content."""
-        from aixtract.converters.pptx import PPTXConverter
-
         converter = PPTXConverter(config)
         result = converter.extract(sample_pptx, filename="sample.pptx")
 
@@ -929,8 +868,6 @@ class TestPPTXConverter:
         self, config: ExtractionConfig, sample_pptx: Path
     ):
         """Metadata includes page_count (slide count)."""
-        from aixtract.converters.pptx import PPTXConverter
-
         converter = PPTXConverter(config)
         result = converter.extract(sample_pptx, filename="sample.pptx")
 
@@ -940,8 +877,6 @@ class TestPPTXConverter:
         self, config: ExtractionConfig, sample_pptx: Path
     ):
         """Markdown content includes slide markers."""
-        from aixtract.converters.pptx import PPTXConverter
-
         converter = PPTXConverter(config)
         result = converter.extract(sample_pptx, filename="sample.pptx")
 
@@ -950,8 +885,6 @@ class TestPPTXConverter:
 
     def test_extract_from_bytes(self, config: ExtractionConfig, sample_pptx: Path):
         """Extract PPTX from raw bytes."""
-        from aixtract.converters.pptx import PPTXConverter
-
         pptx_bytes = sample_pptx.read_bytes()
         converter = PPTXConverter(config)
         result = converter.extract(pptx_bytes, filename="bytes.pptx")
@@ -961,8 +894,6 @@ class TestPPTXConverter:
 
     def test_can_handle_extensions(self):
         """PPTXConverter handles .pptx and .ppt."""
-        from aixtract.converters.pptx import PPTXConverter
-
         assert PPTXConverter.can_handle("pptx") is True
         assert PPTXConverter.can_handle("ppt") is True
         assert PPTXConverter.can_handle("docx") is False
@@ -997,8 +928,6 @@ class TestHTMLConverter:
 
     def test_extract_html_content(self, config: ExtractionConfig):
         """Extract content from HTML bytes."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1008,8 +937,6 @@ class TestHTMLConverter:
 
     def test_title_extracted(self, config: ExtractionConfig):
         """HTML <title> is captured in metadata."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1017,8 +944,6 @@ class TestHTMLConverter:
 
     def test_markdown_conversion_headings(self, config: ExtractionConfig):
         """Headings are converted to markdown heading syntax."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1027,8 +952,6 @@ class TestHTMLConverter:
 
     def test_markdown_conversion_list_items(self, config: ExtractionConfig):
         """List items are converted to markdown bullet points."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1037,8 +960,6 @@ class TestHTMLConverter:
 
     def test_paragraph_text_extracted(self, config: ExtractionConfig):
         """Paragraph text appears in content."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1047,8 +968,6 @@ class TestHTMLConverter:
 
     def test_word_count_in_metadata(self, config: ExtractionConfig):
         """Metadata includes word_count."""
-        from aixtract.converters.html import HTMLConverter
-
         converter = HTMLConverter(config)
         result = converter.extract(self.SAMPLE_HTML, filename="page.html")
 
@@ -1059,8 +978,6 @@ class TestHTMLConverter:
         self, config: ExtractionConfig, tmp_path: Path
     ):
         """Extract HTML from a file path."""
-        from aixtract.converters.html import HTMLConverter
-
         html_file = tmp_path / "test.html"
         html_file.write_bytes(self.SAMPLE_HTML)
 
@@ -1072,16 +989,12 @@ class TestHTMLConverter:
 
     def test_can_handle_extensions(self):
         """HTMLConverter handles .html and .htm."""
-        from aixtract.converters.html import HTMLConverter
-
         assert HTMLConverter.can_handle("html") is True
         assert HTMLConverter.can_handle("htm") is True
         assert HTMLConverter.can_handle("xml") is False
 
     def test_html_without_title(self, config: ExtractionConfig):
         """HTML without a <title> tag handles gracefully."""
-        from aixtract.converters.html import HTMLConverter
-
         html_bytes = b"<html><body><p>No title here</p></body></html>"
         converter = HTMLConverter(config)
         result = converter.extract(html_bytes, filename="notitle.html")
@@ -1110,8 +1023,6 @@ class TestMarkItDownBackend:
 
     def test_can_handle_supported_formats(self, backend):
         """can_handle returns True for supported format extensions."""
-        from aixtract.converters._markitdown import MarkItDownBackend
-
         for ext in [".pdf", ".docx", ".xlsx", ".html", ".txt", ".csv", ".json"]:
             assert backend.can_handle(f"file{ext}") is True
 
@@ -1178,8 +1089,6 @@ class TestConverterRegistration:
 
     def test_text_converters_registered(self):
         """TXT, CSV, JSON, XML converters are registered."""
-        from aixtract.core.registry import ConverterRegistry
-
         # Trigger import
         import aixtract.converters  # noqa: F401
 
@@ -1189,8 +1098,6 @@ class TestConverterRegistration:
 
     def test_archive_converter_registered(self):
         """ZIP converter is registered."""
-        from aixtract.core.registry import ConverterRegistry
-
         import aixtract.converters  # noqa: F401
 
         extensions = ConverterRegistry.get_supported_extensions()
@@ -1198,8 +1105,6 @@ class TestConverterRegistration:
 
     def test_binary_format_converters_registered(self):
         """PDF, DOCX, XLSX, PPTX, HTML converters are registered."""
-        from aixtract.core.registry import ConverterRegistry
-
         import aixtract.converters  # noqa: F401
 
         extensions = ConverterRegistry.get_supported_extensions()
@@ -1208,25 +1113,17 @@ class TestConverterRegistration:
 
     def test_get_converter_for_txt(self):
         """ConverterRegistry returns TXTConverter for .txt extension."""
-        from aixtract.converters.text import TXTConverter
-        from aixtract.core.registry import ConverterRegistry
-
         converter = ConverterRegistry.get_converter(extension=".txt")
         assert converter is not None
         assert isinstance(converter, TXTConverter)
 
     def test_get_converter_for_csv(self):
         """ConverterRegistry returns CSVConverter for .csv extension."""
-        from aixtract.converters.text import CSVConverter
-        from aixtract.core.registry import ConverterRegistry
-
         converter = ConverterRegistry.get_converter(extension=".csv")
         assert converter is not None
         assert isinstance(converter, CSVConverter)
 
     def test_get_converter_returns_none_for_unknown(self):
         """ConverterRegistry returns None for unknown extension."""
-        from aixtract.core.registry import ConverterRegistry
-
         converter = ConverterRegistry.get_converter(extension=".unknown_ext_xyz")
         assert converter is None
@@ -18,9 +18,10 @@ from aixtract.utils.tokens import (
     count_tokens_tiktoken,
     estimate_tokens,
     split_by_tokens,
+    split_file_by_tokens,
 )
 from aixtract.utils.chunking import ContentChunker
-from aixtract.utils.parallel import process_batch
+from aixtract.utils.parallel import process_batch, process_batch_all
 from aixtract.utils.filename import sanitize_filename
 from aixtract.utils.deps import dependencies_required
 from aixtract.utils.logging import get_logger, set_log_level
@@ -309,7 +310,6 @@ class TestSplitByTokens:
         # The split_by_tokens function computes overlap_chars from overlap_tokens.
         # Due to an edge case in the source where overlap can cause non-termination
         # at text boundaries, we verify the overlap calculation logic directly.
-        from aixtract.utils.tokens import CHARS_PER_TOKEN
         encoding = "default"
         overlap_tokens = 10
         chars_per_token = CHARS_PER_TOKEN.get(encoding, 4.0)
@@ -332,6 +332,43 @@ class TestSplitByTokens:
             assert chunk == chunk.strip()
 
 
+class TestSplitFileByTokens:
+    """Tests for split_file_by_tokens."""
+
+    def test_empty_file_returns_empty_list(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert split_file_by_tokens(path, max_tokens=50) == []
+
+    def test_ascii_matches_in_memory_splitter(self, tmp_path):
+        text = "This is a sentence. " * 100
+        path = tmp_path / "ascii.txt"
+        path.write_text(text)
+        assert split_file_by_tokens(path, max_tokens=50) == split_by_tokens(
+            text, max_tokens=50
+        )
+
+    def test_overlap_matches_in_memory_splitter(self, tmp_path):
+        text = "Some text content. " * 100
+        path = tmp_path / "overlap.txt"
+        path.write_text(text)
+        assert split_file_by_tokens(
+            path, max_tokens=50, overlap_tokens=10
+        ) == split_by_tokens(text, max_tokens=50, overlap_tokens=10)
+
+    def test_multibyte_never_cut_mid_character(self, tmp_path):
+        # No separators at all, so raw strides land inside the two-byte
+        # characters and must be nudged back to a UTF-8 boundary
+        text = "é" * 500
+        path = tmp_path / "multibyte.txt"
+        path.write_text(text, encoding="utf-8")
+        chunks = split_file_by_tokens(path, max_tokens=25)
+        assert chunks
+        assert "".join(chunks) == text
+        for chunk in chunks:
+            assert "�" not in chunk
+
+
 # ===========================================================================
 # chunking.py
 # ===========================================================================
@@ -423,6 +460,38 @@ class TestContentChunker:
         chunks = chunker.chunk(text)
         assert len(chunks) > 0
 
+    def test_bare_hash_line_is_not_a_heading(self):
+        # Regression: with \s in the heading pattern the whole-content
+        # scan could consume the newline after a bare "#" line and
+        # classify the following line as heading text
+        chunker = ContentChunker(chunk_size=50, overlap=0)
+        assert chunker.heading_pattern.search("#\nimport os") is None
+        assert chunker.heading_pattern.search("# Heading") is not None
+        text = "#\n# Copyright notice\n#\n" + "import os\nprint('x')\n" * 30
+        chunks = chunker.chunk(text, respect_structure=True)
+        assert len(chunks) > 0
+
+
+class TestChunkBatch:
+    """Tests for ContentChunker.chunk_batch."""
+
+    def test_returns_one_chunk_list_per_document(self):
+        chunker = ContentChunker(chunk_size=50, overlap=0)
+        docs = [f"Document {i} text. " * 50 for i in range(4)]
+        batches = chunker.chunk_batch(docs)
+        assert len(batches) == 4
+        for batch in batches:
+            assert len(batch) > 0
+            assert all(isinstance(c, ContentChunk) for c in batch)
+
+    def test_matches_sequential_chunking(self):
+        chunker = ContentChunker(chunk_size=50, overlap=0)
+        docs = [f"Sentence number {i}. " * 40 for i in range(3)]
+        assert chunker.chunk_batch(docs) == [chunker.chunk(d) for d in docs]
+
+    def test_empty_batch(self):
+        assert ContentChunker().chunk_batch([]) == []
+
 
 # ===========================================================================
 # parallel.py
@@ -487,6 +556,39 @@ class TestProcessBatch:
         assert results[0] == (42, 43)
 
 
+class TestProcessBatchAll:
+    """Tests for process_batch_all and BatchResult."""
+
+    def test_collects_parallel_arrays(self):
+        result = process_batch_all([1, 2, 3], lambda x: x * 2)
+        assert len(result.items) == 3
+        assert len(result.results) == 3
+        assert result.failures == []
+        assert result.as_dict() == {1: 2, 2: 4, 3: 6}
+
+    def test_failures_recorded_by_index(self):
+        def fail_on_3(x):
+            if x == 3:
+                raise ValueError("Cannot process 3")
+            return x * 2
+
+        result = process_batch_all([1, 2, 3, 4], fail_on_3)
+        assert len(result.failures) == 1
+        failed = result.failures[0]
+        assert result.items[failed] == 3
+        assert isinstance(result.results[failed], ValueError)
+
+    def test_unhashable_items(self):
+        result = process_batch_all([{"a": 1}, {"b": 2, "c": 3}], len)
+        assert sorted(result.results) == [1, 2]
+
+    def test_empty_items(self):
+        result = process_batch_all([], lambda x: x)
+        assert result.items == []
+        assert result.results == []
+        assert result.failures == []
+
+
 # ===========================================================================
 # filename.py
 # ===========================================================================